@@ -1009,7 +1009,9 @@ class SeasonAdmin(_BaseAdmin):
         return redirect("admin:round_transition", object_id=queryset[0].pk)
 
     def round_transition_view(self, request, object_id):
-        season = get_object_or_404(Season, pk=object_id)
+        season = get_object_or_404(
+            Season.objects.select_related("league"), pk=object_id
+        )
         if not request.user.has_perm("tournament.generate_pairings", season.league):
             raise PermissionDenied
 
@@ -1187,9 +1189,9 @@ class SeasonAdmin(_BaseAdmin):
             raise PermissionDenied
 
         if request.method == "POST":
-            form = forms.TeamSpamForm(season, request.POST)
+            teams = list(season.team_set.all())
+            form = forms.TeamSpamForm(season, request.POST, team_count=len(teams))
             if form.is_valid() and form.cleaned_data["confirm_send"]:
-                teams = season.team_set.all()
                 for t in teams:
                     if t.slack_channel:
                         slackapi.send_message(
@@ -6,11 +6,31 @@ and adds database persistence capabilities for testing and seeding.
 """
 
 import random
-from typing import Union, Tuple
+import traceback
+from functools import cached_property
+from typing import List, Sequence, Tuple, Union
+
+import reversion
+from cacheops import invalidate_model
+from django.db import connection, transaction
 
 from heltour.tournament_core.builder import TournamentBuilder as CoreTournamentBuilder
+from heltour.tournament_core.elo import elo_expected_batch
+from heltour.tournament.models import (
+    LonePlayerPairing,
+    Round,
+    TeamPairing,
+    TeamPlayerPairing,
+)
+from heltour.tournament.db_to_structure import season_team_player_ids
+from heltour.tournament.pairinggen import generate_pairings
 from heltour.tournament.structure_to_db import structure_to_db
 
+# Bound methods of the shared module-level generator, so random.seed() still
+# makes simulations reproducible
+_rand = random.random
+_rand_bits = random.getrandbits
+
 
 def simulate_game_result(
     white_rating: int,
@@ -29,29 +49,131 @@ def simulate_game_result(
     Returns:
         Result string: '1-0', '1/2-1/2', '0-1', '1X-0F', '0F-1X', or '0F-0F'
     """
-    # Small chance of forfeit
-    if allow_forfeit and random.random() < forfeit_rate:
-        forfeit_type = random.random()
-        if forfeit_type < 0.4:
-            return "1X-0F"  # Black forfeits
-        elif forfeit_type < 0.8:
-            return "0F-1X"  # White forfeits
+    return simulate_game_results(
+        [white_rating], [black_rating], allow_forfeit, forfeit_rate
+    )[0]
+
+
+def simulate_game_results(
+    white_ratings: Sequence[int],
+    black_ratings: Sequence[int],
+    allow_forfeit: bool = True,
+    forfeit_rate: float = 0.05,
+) -> List[str]:
+    """Simulate a batch of game results based on ratings.
+
+    Simulating a whole round in one call keeps the per-game work to a single
+    pass over the ratings instead of one function dispatch per board.
+
+    Args:
+        white_ratings: White players' ratings, one per game
+        black_ratings: Black players' ratings, in the same order
+        allow_forfeit: Whether to allow forfeit results
+        forfeit_rate: Probability of a forfeit (default 5%)
+
+    Returns:
+        Result strings in the same order as the ratings
+    """
+    if len(white_ratings) != len(black_ratings):
+        raise ValueError("white_ratings and black_ratings must have the same length")
+    expected_scores = elo_expected_batch(white_ratings, black_ratings)
+
+    # Bind loop invariants to locals; this loop runs once per simulated board
+    rand = _rand
+    rand_bits = _rand_bits
+    # Forfeits are decided on 16 random bits rather than a float draw
+    forfeit_threshold = int(forfeit_rate * 65536) if allow_forfeit else 0
+    results = []
+    append = results.append
+    for exp_white in expected_scores:
+        # Small chance of forfeit
+        if rand_bits(16) < forfeit_threshold:
+            forfeit_type = rand_bits(8)
+            if forfeit_type < 102:  # ~40%
+                append("1X-0F")  # Black forfeits
+            elif forfeit_type < 205:  # ~40%
+                append("0F-1X")  # White forfeits
+            else:
+                append("0F-0F")  # Both forfeit
+            continue
+
+        # Add some randomness
+        roll = rand()
+
+        # Adjust probabilities for more realistic results
+        if roll < exp_white - 0.1:
+            append("1-0")
+        elif roll < exp_white + 0.1:
+            append("1/2-1/2")
         else:
-            return "0F-0F"  # Both forfeit
+            append("0-1")
+    return results
+
+
+def _update_from_values(model, objs, fields):
+    """Write ``fields`` for every object in ``objs`` with a single UPDATE.
+
+    On PostgreSQL this issues one ``UPDATE ... FROM (VALUES ...)`` statement;
+    other databases fall back to ``bulk_update``. All fields must live on the
+    same table (which may be a multi-table inheritance parent of ``model``).
+    Like ``bulk_update``, no ``save()`` hooks or signals are run.
+    """
+    objs = list(objs)
+    if not objs:
+        return
+    if connection.vendor != "postgresql":
+        model.objects.bulk_update(objs, fields, batch_size=500)
+        return
+
+    from psycopg2.extras import execute_values
+
+    db_fields = [model._meta.get_field(name) for name in fields]
+    table_model = db_fields[0].model
+    columns = [field.column for field in db_fields]
+    set_clause = ", ".join(f'"{column}" = v."{column}"' for column in columns)
+    value_columns = ", ".join(f'"{column}"' for column in columns)
+    sql = (
+        f'UPDATE "{table_model._meta.db_table}" AS t SET {set_clause} '
+        f"FROM (VALUES %s) AS v(pk, {value_columns}) "
+        f'WHERE t."{table_model._meta.pk.column}" = v.pk'
+    )
+    rows = [
+        (
+            obj.pk,
+            *(
+                field.get_db_prep_save(getattr(obj, field.attname), connection)
+                for field in db_fields
+            ),
+        )
+        for obj in objs
+    ]
+    with connection.cursor() as cursor:
+        execute_values(cursor.cursor, sql, rows, page_size=500)
+
+    # Raw SQL bypasses cacheops' automatic invalidation
+    invalidate_model(model)
+    if table_model is not model:
+        invalidate_model(table_model)
 
-    # Calculate expected score using Elo formula
-    exp_white = 1 / (1 + 10 ** ((black_rating - white_rating) / 400))
 
-    # Add some randomness
-    rand = random.random()
+class SimulatorCompat:
+    """Simulator-like view over built database objects, for compatibility."""
+
+    def __init__(self, db_objects, metadata):
+        self.db_objects = db_objects
+        self.metadata = metadata
+
+    @property
+    def leagues(self):
+        return {self.metadata.league_tag: self.db_objects["league"]}
+
+    @property
+    def seasons(self):
+        return {self.metadata.season_name: self.db_objects["season"]}
 
-    # Adjust probabilities for more realistic results
-    if rand < exp_white - 0.1:
-        return "1-0"
-    elif rand < exp_white + 0.1:
-        return "1/2-1/2"
-    else:
-        return "0-1"
+    @property
+    def current_season(self):
+        return self.db_objects["season"]
 
 
 class TournamentBuilder:
@@ -178,16 +300,14 @@ class TournamentBuilder:
         """Calculate standings."""
         self.core_builder.calculate()
         # Ensure DB objects are built before calculating
-        if self._db_objects is None:
-            self._build_db_objects()
+        self._build_db_objects()
         # Recalculate scores in database
         self._db_objects["season"].calculate_scores()
         return self
 
     def build(self) -> "TournamentBuilder":
         """Build database objects and return self for chaining."""
-        if self._db_objects is None:
-            self._build_db_objects()
+        self._build_db_objects()
         return self
 
     # Database-specific methods
@@ -209,13 +329,16 @@ class TournamentBuilder:
         ):
             self.current_round = self._db_objects["rounds"][self._round_number - 1]
 
+    @cached_property
+    def _is_team_league(self):
+        """Whether the built season belongs to a team league."""
+        self._build_db_objects()
+        return self._db_objects["season"].league.is_team_league()
+
     def start_round(self, round_number: int, generate_pairings_auto: bool = False):
         """Start a round, optionally generating pairings with JavaFo."""
-        from heltour.tournament.models import Round
-
         # Ensure DB objects exist
-        if self._db_objects is None:
-            self._build_db_objects()
+        self._build_db_objects()
 
         # Create a new round in the database
         round_obj = Round.objects.create(
@@ -226,16 +349,10 @@ class TournamentBuilder:
         if generate_pairings_auto:
             try:
                 # Wrap in reversion context for pairing generation
-                import reversion
-
                 with reversion.create_revision():
                     reversion.set_comment("Test pairing generation")
-                    from heltour.tournament.pairinggen import generate_pairings
-
                     generate_pairings(round_obj)
             except Exception as e:
-                import traceback
-
                 print(f"Failed to generate pairings: {e}")
                 traceback.print_exc()
 
@@ -245,56 +362,88 @@ class TournamentBuilder:
 
     def simulate_round_results(self, round_obj):
         """Simulate results for all pairings in a round."""
-        from heltour.tournament.models import TeamPairing, LonePlayerPairing
-
         if not self._db_objects:
             return
 
         season = self._db_objects["season"]
-        if season.league.competitor_type == "team":
-            for pairing in TeamPairing.objects.filter(round=round_obj):
-                for board_pairing in pairing.teamplayerpairing_set.order_by(
-                    "board_number"
-                ):
-                    white_rating = board_pairing.white.rating or 1500
-                    black_rating = board_pairing.black.rating or 1500
-                    result = simulate_game_result(white_rating, black_rating)
-                    board_pairing.result = result
-                    board_pairing.save()
-                pairing.refresh_points()
-                pairing.save()
+        if self._is_team_league:
+            # Fetch every board in the round in one query and write results back
+            # in one statement rather than saving (and re-scoring) board by board
+            board_pairings = list(
+                TeamPlayerPairing.objects.filter(team_pairing__round=round_obj)
+                .select_related("white", "black", "team_pairing")
+                .order_by("team_pairing__pairing_order", "board_number")
+                .nocache()
+            )
+            results = simulate_game_results(
+                [bp.white.rating or 1500 for bp in board_pairings],
+                [bp.black.rating or 1500 for bp in board_pairings],
+            )
+            for board_pairing, result in zip(board_pairings, results):
+                board_pairing.result = result
+            _update_from_values(TeamPlayerPairing, board_pairings, ["result"])
+
+            # Score every team pairing from one fetch of the season's members
+            team_player_ids = season_team_player_ids(season)
+            team_pairings = {bp.team_pairing_id: bp.team_pairing for bp in board_pairings}
+            for pairing in team_pairings.values():
+                pairing.refresh_points(
+                    team_player_ids[pairing.white_team_id],
+                    team_player_ids[pairing.black_team_id],
+                )
+            _update_from_values(
+                TeamPairing,
+                team_pairings.values(),
+                ["white_points", "black_points", "white_wins", "black_wins"],
+            )
         else:
-            for pairing in LonePlayerPairing.objects.filter(round=round_obj):
-                white_rating = pairing.white.rating or 1500
-                black_rating = pairing.black.rating or 1500
-                result = simulate_game_result(white_rating, black_rating)
+            pairings = list(
+                LonePlayerPairing.objects.filter(round=round_obj)
+                .select_related("white", "black")
+                .nocache()
+            )
+            results = simulate_game_results(
+                [pairing.white.rating or 1500 for pairing in pairings],
+                [pairing.black.rating or 1500 for pairing in pairings],
+            )
+            for pairing, result in zip(pairings, results):
                 pairing.result = result
-                pairing.save()
-
-    def complete_round(self, round_obj):
-        """Complete a round, simulating results if needed."""
-        from heltour.tournament.models import TeamPairing
-
-        # If there are pairings without results, simulate them
-        if self._db_objects and self._db_objects.get("season"):
-            season = self._db_objects["season"]
-            if season.league.competitor_type == "team":
-                # Check if any pairings lack results
-                pairings_without_results = (
-                    TeamPairing.objects.filter(round=round_obj)
-                    .filter(teamplayerpairing__result="")
-                    .distinct()
-                )
-                if pairings_without_results.exists():
-                    self.simulate_round_results(round_obj)
+            _update_from_values(LonePlayerPairing, pairings, ["result"])
 
-        # Mark the round as completed
-        round_obj.is_completed = True
-        round_obj.save()
+        # Bulk updates skip the save() hooks, so rescore a completed round here
+        if round_obj.is_completed:
+            season.calculate_scores()
 
-        # Calculate scores after completing the round
-        if self._db_objects and self._db_objects.get("season"):
-            self._db_objects["season"].calculate_scores()
+    def complete_round(self, round_obj):
+        """Complete a round, simulating results if needed.
+
+        Simulation, completion and scoring run in one transaction, and the
+        season is scored once at the end rather than after every write.
+        """
+        with transaction.atomic():
+            # If there are pairings without results, simulate them
+            if self._db_objects and self._db_objects.get("season"):
+                if self._is_team_league:
+                    # Check if any pairings lack results
+                    pairings_without_results = (
+                        TeamPairing.objects.filter(round=round_obj)
+                        .filter(teamplayerpairing__result="")
+                        .distinct()
+                    )
+                    if pairings_without_results.exists():
+                        self.simulate_round_results(round_obj)
+
+            # Mark the round as completed. Round.save() recalculates the season
+            # scores when is_completed changes, so only score explicitly if the
+            # round was already completed.
+            completion_changed = not round_obj.initial_is_completed
+            round_obj.is_completed = True
+            round_obj.save()
+
+            if not completion_changed and self._db_objects and self._db_objects.get(
+                "season"
+            ):
+                self._db_objects["season"].calculate_scores()
 
     def calculate_standings(self):
         """Calculate standings (alias for calculate)."""
@@ -302,44 +451,22 @@ class TournamentBuilder:
 
     # Compatibility properties
 
-    @property
+    @cached_property
     def seasons(self):
         """Access seasons dictionary for compatibility."""
-        if self._db_objects is None:
-            self._build_db_objects()
+        self._build_db_objects()
         return {self.core_builder.metadata.season_name: self._db_objects["season"]}
 
-    @property
+    @cached_property
     def current_season(self):
         """Access current season for compatibility."""
-        if self._db_objects is None:
-            self._build_db_objects()
+        self._build_db_objects()
         return self._db_objects["season"]
 
-    @property
+    @cached_property
     def simulator(self):
         """Access simulator-like properties for compatibility."""
-        if self._db_objects is None:
-            self._build_db_objects()
-
-        # Return an object that has leagues and seasons properties
-        class SimulatorCompat:
-            def __init__(self, db_objects, metadata):
-                self.db_objects = db_objects
-                self.metadata = metadata
-
-            @property
-            def leagues(self):
-                return {self.metadata.league_tag: self.db_objects["league"]}
-
-            @property
-            def seasons(self):
-                return {self.metadata.season_name: self.db_objects["season"]}
-
-            @property
-            def current_season(self):
-                return self.db_objects["season"]
-
+        self._build_db_objects()
         return SimulatorCompat(self._db_objects, self.core_builder.metadata)
 
     # Backwards compatibility methods
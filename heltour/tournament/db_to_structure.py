@@ -6,6 +6,8 @@ into the clean tournament_core structure for tiebreak calculations and analysis.
 """
 
 from collections import defaultdict
+from itertools import chain, groupby
+from operator import attrgetter, itemgetter
 from typing import Optional
 
 from heltour.tournament.models import (
@@ -15,8 +17,10 @@ from heltour.tournament.models import (
     SeasonPlayer,
     Team,
     TeamBye,
+    TeamMember,
     TeamMultiMatchProgress,
     TeamPairing,
+    TeamPlayerPairing,
 )
 from heltour.tournament_core.multi_match import (
     _find_match_by_pairing_order_and_match_number,
@@ -25,6 +29,7 @@ from heltour.tournament_core.multi_match import (
 )
 from heltour.tournament_core.scoring import STANDARD_SCORING, ScoringSystem
 from heltour.tournament_core.structure import (
+    REVERSED_GAME_RESULTS,
     GameResult,
     Match,
     Round,
@@ -32,12 +37,54 @@ from heltour.tournament_core.structure import (
     TournamentFormat,
     create_bye_match,
     create_scored_bye_match,
-    create_single_game_match,
     create_team_match,
 )
 
-
-def calculate_team_pairing_scores(team_pairing):
+# Map database results to GameResult enum
+_RESULT_MAP = {
+    "1-0": GameResult.P1_WIN,
+    "1/2-1/2": GameResult.DRAW,
+    "0-1": GameResult.P2_WIN,
+    "1X-0F": GameResult.P1_FORFEIT_WIN,
+    "0F-1X": GameResult.P2_FORFEIT_WIN,
+    "0F-0F": GameResult.DOUBLE_FORFEIT,
+}
+
+# (white score, black score) by (result, colors_reversed), matching
+# PlayerPairing.white_score() and black_score()
+_SCORE_MAP = {
+    ("1-0", False): (1, 0),
+    ("1-0", True): (0, 1),
+    ("1X-0F", False): (1, 0),
+    ("1X-0F", True): (0, 1),
+    ("0-1", False): (0, 1),
+    ("0-1", True): (1, 0),
+    ("0F-1X", False): (0, 1),
+    ("0F-1X", True): (1, 0),
+    ("0F-0F", False): (0, 0),
+    ("0F-0F", True): (1, 1),
+    ("1/2-1/2", False): (0.5, 0.5),
+    ("1/2-1/2", True): (0.5, 0.5),
+    ("1/2Z-1/2Z", False): (0.5, 0.5),
+    ("1/2Z-1/2Z", True): (0.5, 0.5),
+}
+
+# Same results as seen from the other color, for colors_reversed pairings
+_RESULT_MAP_REVERSED = {
+    result_str: REVERSED_GAME_RESULTS[game_result]
+    for result_str, game_result in _RESULT_MAP.items()
+}
+
+# Result maps indexed by colors_reversed, so a conversion is a single lookup
+_RESULT_MAPS = (_RESULT_MAP, _RESULT_MAP_REVERSED)
+
+
+def calculate_team_pairing_scores(
+    team_pairing,
+    use_cache=True,
+    white_team_player_ids=None,
+    black_team_player_ids=None,
+):
     """Calculate the correct scores for a team pairing based on board results.
 
     This is the single source of truth for team pairing score calculation.
@@ -45,64 +92,94 @@ def calculate_team_pairing_scores(team_pairing):
 
     Args:
         team_pairing: A TeamPairing model instance
+        use_cache: Whether the board pairings may be read from the query cache;
+            pass False right after changing results
+        white_team_player_ids: Optional pre-fetched player IDs of the white
+            team's members; both teams' IDs must be given to skip the query
+        black_team_player_ids: Optional pre-fetched player IDs of the black
+            team's members
 
     Returns:
         tuple: (white_points, black_points, white_wins, black_wins)
     """
-    white_team_points = 0.0
-    black_team_points = 0.0
-    white_team_wins = 0
-    black_team_wins = 0
-
-    # Get team member player IDs for efficient lookup
-    white_team_player_ids = set(
-        team_pairing.white_team.teammember_set.values_list("player_id", flat=True)
-    )
-    black_team_player_ids = set(
-        team_pairing.black_team.teammember_set.values_list("player_id", flat=True)
-    )
-
-    for board_pairing in (
-        team_pairing.teamplayerpairing_set.all().nocache().order_by("board_number")
-    ):
-        # Skip boards with no result
-        if not board_pairing.result:
+    # Points and wins indexed by side: 0 for the white team, 1 for the black team
+    team_points = [0.0, 0.0]
+    team_wins = [0, 0]
+
+    # Get team member player IDs for both teams in one query
+    if white_team_player_ids is None or black_team_player_ids is None:
+        white_team_id = team_pairing.white_team_id
+        white_team_player_ids = set()
+        black_team_player_ids = set()
+        for team_id, player_id in TeamMember.objects.filter(
+            team_id__in=(white_team_id, team_pairing.black_team_id)
+        ).values_list("team_id", "player_id"):
+            if team_id == white_team_id:
+                white_team_player_ids.add(player_id)
+            else:
+                black_team_player_ids.add(player_id)
+
+    # Side of each member; white team membership wins if a player is on both
+    player_side = dict.fromkeys(black_team_player_ids, 1)
+    player_side.update(dict.fromkeys(white_team_player_ids, 0))
+
+    board_pairings = team_pairing.teamplayerpairing_set.all()
+    if not use_cache:
+        board_pairings = board_pairings.nocache()
+    for white_id, black_id, result, colors_reversed in board_pairings.order_by(
+        "board_number"
+    ).values_list("white_id", "black_id", "result", "colors_reversed"):
+        # Skip boards with no result or no players
+        if not result:
+            continue
+        if not white_id and not black_id:
             continue
 
         # Get the piece-color scores (white's perspective)
-        white_score = board_pairing.white_score() or 0
-        black_score = board_pairing.black_score() or 0
+        white_score, black_score = _SCORE_MAP.get((result, colors_reversed), (0, 0))
 
         # Skip if no actual score (both 0)
         if white_score == 0 and black_score == 0:
             continue
 
-        # For each non-None player, determine which team they're on
-        if board_pairing.white_id:
-            if board_pairing.white_id in white_team_player_ids:
-                # White pieces player is on white team
-                white_team_points += white_score
-                if white_score == 1:
-                    white_team_wins += 1
-            elif board_pairing.white_id in black_team_player_ids:
-                # White pieces player is on black team
-                black_team_points += white_score
-                if white_score == 1:
-                    black_team_wins += 1
-
-        if board_pairing.black_id:
-            if board_pairing.black_id in white_team_player_ids:
-                # Black pieces player is on white team
-                white_team_points += black_score
-                if black_score == 1:
-                    white_team_wins += 1
-            elif board_pairing.black_id in black_team_player_ids:
-                # Black pieces player is on black team
-                black_team_points += black_score
-                if black_score == 1:
-                    black_team_wins += 1
-
-    return white_team_points, black_team_points, white_team_wins, black_team_wins
+        # Credit each player's score to the team they're on (missing players
+        # and non-members have no side)
+        side = player_side.get(white_id)
+        if side is not None:
+            team_points[side] += white_score
+            if white_score == 1:
+                team_wins[side] += 1
+
+        side = player_side.get(black_id)
+        if side is not None:
+            team_points[side] += black_score
+            if black_score == 1:
+                team_wins[side] += 1
+
+    return team_points[0], team_points[1], team_wins[0], team_wins[1]
+
+
+def season_team_player_ids(season):
+    """Return the member player IDs of every team in a season in one query.
+
+    Returns:
+        defaultdict mapping team_id to a frozenset of player IDs, empty for
+        teams without members
+    """
+    team_player_ids = defaultdict(list)
+    for team_id, player_id in (
+        TeamMember.objects.filter(team__season=season)
+        .values_list("team_id", "player_id")
+        .iterator(chunk_size=200)
+    ):
+        team_player_ids[team_id].append(player_id)
+    return defaultdict(
+        frozenset,
+        {
+            team_id: frozenset(player_ids)
+            for team_id, player_ids in team_player_ids.items()
+        },
+    )
 
 
 def _result_to_game_result(
@@ -117,69 +194,109 @@ def _result_to_game_result(
     Returns:
         GameResult enum value or None if result is empty/invalid
     """
-    if not result_str:
-        return None
-
-    # Map database results to GameResult enum
-    result_map = {
-        "1-0": GameResult.P1_WIN,
-        "1/2-1/2": GameResult.DRAW,
-        "0-1": GameResult.P2_WIN,
-        "1X-0F": GameResult.P1_FORFEIT_WIN,
-        "0F-1X": GameResult.P2_FORFEIT_WIN,
-        "0F-0F": GameResult.DOUBLE_FORFEIT,
-    }
-
-    game_result = result_map.get(result_str)
-    if game_result is None:
-        return None
-
-    # Reverse the result if colors are reversed
-    if colors_reversed:
-        if game_result == GameResult.P1_WIN:
-            game_result = GameResult.P2_WIN
-        elif game_result == GameResult.P2_WIN:
-            game_result = GameResult.P1_WIN
-        elif game_result == GameResult.P1_FORFEIT_WIN:
-            game_result = GameResult.P2_FORFEIT_WIN
-        elif game_result == GameResult.P2_FORFEIT_WIN:
-            game_result = GameResult.P1_FORFEIT_WIN
+    return _RESULT_MAPS[bool(colors_reversed)].get(result_str)
 
-    return game_result
 
-
-def team_tournament_to_structure(season) -> Tournament:
+def team_tournament_to_structure(
+    season,
+    scoring: Optional[ScoringSystem] = None,
+    group_multi_match_rounds: bool = False,
+) -> Tournament:
     """Convert a team tournament season to tournament_core structure.
 
     Args:
         season: A Season model instance from the database
+        scoring: Optional custom scoring system (defaults to STANDARD_SCORING)
+        group_multi_match_rounds: Aggregate rounds that share a
+            knockout_multi_round_group into a single round
 
     Returns:
         Tournament object with all rounds, matches, and games
     """
+    scoring = scoring or STANDARD_SCORING
+
     # Get all teams in the season
     teams = list(Team.objects.filter(season=season).values_list("id", flat=True))
 
     # Determine tournament format
-    format_type = TournamentFormat.KNOCKOUT if season.league.pairing_type in ['knockout-single', 'knockout-multi'] else TournamentFormat.SWISS
+    league = season.league
+    is_knockout = league.pairing_type in ['knockout-single', 'knockout-multi']
+    format_type = TournamentFormat.KNOCKOUT if is_knockout else TournamentFormat.SWISS
+    games_per_match = (league.knockout_games_per_match or 1) if is_knockout else 1
+
+    # Nothing to convert until a round has been completed
+    completed_rounds = list(
+        season.round_set.filter(is_completed=True).order_by("number")
+    )
+    if not completed_rounds:
+        return Tournament(teams, [], scoring, format_type)
+
+    boards = season.boards
+
+    # Fetch the board pairings of every completed round in a single query,
+    # grouped by team pairing and ordered by board
+    board_pairings_by_team_pairing = {
+        team_pairing_id: [row[1:] for row in rows]
+        for team_pairing_id, rows in groupby(
+            TeamPlayerPairing.objects.filter(
+                team_pairing__round__season=season,
+                team_pairing__round__is_completed=True,
+            )
+            .order_by("team_pairing_id", "board_number")
+            .values_list(
+                "team_pairing_id", "white_id", "black_id", "result", "colors_reversed"
+            )
+            .iterator(chunk_size=200),
+            key=itemgetter(0),
+        )
+    }
+
+    team_player_ids = season_team_player_ids(season)
+
+    # Fetch the team pairings and team byes of every completed round up front,
+    # grouped by round
+    team_pairings_by_round = defaultdict(list)
+    # Only load the columns used here (TeamPairing.__init__ reads the points)
+    for team_pairing in (
+        TeamPairing.objects.filter(round__season=season, round__is_completed=True)
+        .only(
+            "round",
+            "white_team",
+            "black_team",
+            "manual_tiebreak_value",
+            "white_points",
+            "black_points",
+        )
+        .iterator(chunk_size=200)
+    ):
+        team_pairings_by_round[team_pairing.round_id].append(team_pairing)
+
+    bye_team_ids_by_round = defaultdict(list)
+    for round_id, team_id in (
+        TeamBye.objects.filter(round__season=season, round__is_completed=True)
+        .values_list("round_id", "team_id")
+        .iterator(chunk_size=200)
+    ):
+        bye_team_ids_by_round[round_id].append(team_id)
+
+    # Team byes are scored per board, so validate the boards count once up front
+    if bye_team_ids_by_round and (not boards or boards <= 0):
+        raise ValueError(
+            f"Season {season} has invalid boards count: {boards}. "
+            "Team tournaments require a positive boards count."
+        )
 
     # Get all completed rounds ordered by number
-    rounds = []
-    for round_obj in season.round_set.filter(is_completed=True).order_by("number"):
+    round_entries = []
+    result_maps = _RESULT_MAPS
+    for round_obj in completed_rounds:
         matches = []
 
         # Get all team pairings for this round
-        for team_pairing in (
-            TeamPairing.objects.filter(round=round_obj)
-            .select_related("white_team", "black_team")
-            .prefetch_related("teamplayerpairing_set")
-        ):
+        for team_pairing in team_pairings_by_round[round_obj.id]:
 
             # Get all board pairings for this team match
-            board_results = []
-            board_pairings = list(
-                team_pairing.teamplayerpairing_set.all().order_by("board_number")
-            )
+            board_pairings = board_pairings_by_team_pairing.get(team_pairing.id)
 
             # Team tournaments must have board pairings to calculate results
             if not board_pairings:
@@ -189,34 +306,35 @@ def team_tournament_to_structure(season) -> Tournament:
                     "Team tournaments require individual board results."
                 )
 
-            for board_pairing in board_pairings:
-                # Handle forfeit wins where one player is missing
-                if not board_pairing.white_id and not board_pairing.black_id:
-                    continue  # Skip completely empty boards
-
-                game_result = _result_to_game_result(
-                    board_pairing.result, board_pairing.colors_reversed
-                )
-                if game_result is None:
-                    continue  # Skip games without results
-
-                # Simply use the white/black player IDs as they are
-                # Player1 is whoever has white pieces, Player2 has black pieces
-                player1_id = board_pairing.white_id or -1  # -1 for forfeit
-                player2_id = board_pairing.black_id or -1  # -1 for forfeit
-
-                board_results.append((player1_id, player2_id, game_result))
+            # Simply use the white/black player IDs as they are
+            # Player1 is whoever has white pieces, Player2 has black pieces,
+            # with -1 for a missing (forfeiting) player. Completely empty boards
+            # and games without results are skipped.
+            board_results = [
+                (white_id or -1, black_id or -1, game_result)
+                for white_id, black_id, result, colors_reversed in board_pairings
+                if (white_id or black_id)
+                and (game_result := result_maps[colors_reversed].get(result))
+                is not None
+            ]
 
             if board_results:
-                # Build player to team mapping
-                player_team_mapping = {}
-
-                # Get all team members
-                for tm in team_pairing.white_team.teammember_set.all():
-                    player_team_mapping[tm.player_id] = team_pairing.white_team_id
+                # Build player to team mapping from both teams' members
+                player_team_mapping = dict.fromkeys(
+                    team_player_ids[team_pairing.white_team_id],
+                    team_pairing.white_team_id,
+                )
+                player_team_mapping.update(
+                    dict.fromkeys(
+                        team_player_ids[team_pairing.black_team_id],
+                        team_pairing.black_team_id,
+                    )
+                )
 
-                for tm in team_pairing.black_team.teammember_set.all():
-                    player_team_mapping[tm.player_id] = team_pairing.black_team_id
+                # For knockout tournaments, add manual tiebreak and games per match
+                manual_tiebreak = (
+                    team_pairing.manual_tiebreak_value if is_knockout else None
+                )
 
                 # Create match with knockout-specific properties
                 match = create_team_match(
@@ -224,125 +342,153 @@ def team_tournament_to_structure(season) -> Tournament:
                     team_pairing.black_team_id,
                     board_results,
                     player_team_mapping,
+                    games_per_match=games_per_match,
+                    manual_tiebreak_value=manual_tiebreak,
                 )
-                
-                # For knockout tournaments, add manual tiebreak and games per match
-                if format_type == TournamentFormat.KNOCKOUT:
-                    games_per_match = season.league.knockout_games_per_match or 1
-                    manual_tiebreak = team_pairing.manual_tiebreak_value
-                    
-                    # Create match with knockout properties
-                    match = Match(
-                        competitor1_id=match.competitor1_id,
-                        competitor2_id=match.competitor2_id,
-                        games=match.games,
-                        is_bye=match.is_bye,
-                        games_per_match=games_per_match,
-                        manual_tiebreak_value=manual_tiebreak
-                    )
-                
                 matches.append(match)
 
         # Add bye matches for teams with TeamBye records
-        for team_bye in TeamBye.objects.filter(round=round_obj).select_related("team"):
-            # Team tournaments must have a valid boards count
-            boards = season.boards
-            if not boards or boards <= 0:
-                raise ValueError(
-                    f"Season {season} has invalid boards count: {boards}. "
-                    "Team tournaments require a positive boards count."
-                )
-            matches.append(create_bye_match(team_bye.team_id, boards))
+        matches.extend(
+            create_bye_match(team_id, boards)
+            for team_id in bye_team_ids_by_round.get(round_obj.id, ())
+        )
 
+        round_structure = None
         if matches:
-            knockout_stage = round_obj.knockout_stage if format_type == TournamentFormat.KNOCKOUT else None
-            rounds.append(Round(round_obj.number, matches, knockout_stage))
+            knockout_stage = round_obj.knockout_stage if is_knockout else None
+            round_structure = Round(round_obj.number, matches, knockout_stage)
+        round_entries.append((round_obj, round_structure))
+
+    rounds = _collect_rounds(round_entries, group_multi_match_rounds, games_per_match)
 
     # Create the tournament with appropriate format
-    return Tournament(teams, rounds, STANDARD_SCORING, format_type)
+    return Tournament(teams, rounds, scoring, format_type)
 
 
-def lone_tournament_to_structure(season) -> Tournament:
+def lone_tournament_to_structure(
+    season,
+    scoring: Optional[ScoringSystem] = None,
+    group_multi_match_rounds: bool = False,
+) -> Tournament:
     """Convert an individual (lone) tournament season to tournament_core structure.
 
     Args:
         season: A Season model instance from the database
+        scoring: Optional custom scoring system (defaults to STANDARD_SCORING)
+        group_multi_match_rounds: Aggregate rounds that share a
+            knockout_multi_round_group into a single round
 
     Returns:
         Tournament object with all rounds, matches, and games
     """
+    scoring = scoring or STANDARD_SCORING
+
     # Get all players in the season
     players = list(
         SeasonPlayer.objects.filter(season=season).values_list("player_id", flat=True)
     )
 
     # Determine tournament format
-    format_type = TournamentFormat.KNOCKOUT if season.league.pairing_type in ['knockout-single', 'knockout-multi'] else TournamentFormat.SWISS
+    is_knockout = season.league.pairing_type in ['knockout-single', 'knockout-multi']
+    format_type = TournamentFormat.KNOCKOUT if is_knockout else TournamentFormat.SWISS
+
+    # Nothing to convert until a round has been completed
+    completed_rounds = list(
+        season.round_set.filter(is_completed=True).order_by("number")
+    )
+    if not completed_rounds:
+        return Tournament(players, [], scoring, format_type)
+
+    # Fetch the player pairings of every completed round as plain rows, grouped
+    # by round
+    pairing_rows_by_round = defaultdict(list)
+    for round_id, *row in (
+        LonePlayerPairing.objects.filter(
+            round__season=season, round__is_completed=True
+        )
+        .values_list("round_id", "white_id", "black_id", "result", "colors_reversed")
+        .iterator(chunk_size=200)
+    ):
+        pairing_rows_by_round[round_id].append(row)
+
+    # Byes only count towards Swiss standings
+    players_set = set(players)
+    byes_by_round = defaultdict(dict)
+    if format_type == TournamentFormat.SWISS:
+        for bye in (
+            PlayerBye.objects.filter(round__season=season, round__is_completed=True)
+            .only("round", "player", "type")
+            .iterator(chunk_size=200)
+        ):
+            byes_by_round[bye.round_id][bye.player_id] = bye
 
     # Get all completed rounds ordered by number
-    rounds = []
-    for round_obj in season.round_set.filter(is_completed=True).order_by("number"):
-        matches = []
+    round_entries = []
+    result_maps = _RESULT_MAPS
+    for round_obj in completed_rounds:
+        # Collect the games as parallel columns and build the matches in one go
+        white_ids = []
+        black_ids = []
+        game_results = []
+        players_that_played = set()
 
         # Get all player pairings for this round
-        for pairing in LonePlayerPairing.objects.filter(round=round_obj).select_related(
-            "white", "black"
-        ):
-            if not pairing.white_id or not pairing.black_id:
+        for white_id, black_id, result, colors_reversed in pairing_rows_by_round[
+            round_obj.id
+        ]:
+            if not white_id or not black_id:
                 continue  # Skip empty pairings
 
-            game_result = _result_to_game_result(
-                pairing.result, pairing.colors_reversed
-            )
+            game_result = result_maps[colors_reversed].get(result)
             if game_result is None:
                 continue  # Skip games without results
 
-            match = create_single_game_match(
-                pairing.white_id, pairing.black_id, game_result
-            )
-            
-            # For knockout tournaments, add games per match (always 1 for individual)
-            if format_type == TournamentFormat.KNOCKOUT:
-                match = Match(
-                    competitor1_id=match.competitor1_id,
-                    competitor2_id=match.competitor2_id,
-                    games=match.games,
-                    is_bye=match.is_bye,
-                    games_per_match=1,
-                    manual_tiebreak_value=None  # Individual knockout doesn't use manual tiebreaks
-                )
-            
-            matches.append(match)
+            white_ids.append(white_id)
+            black_ids.append(black_id)
+            game_results.append(game_result)
+            players_that_played.add(white_id)
+            players_that_played.add(black_id)
+
+        # Individual knockout matches are single games without manual tiebreaks,
+        # which is exactly what the single-game matches default to
+        knockout_stage = round_obj.knockout_stage if is_knockout else None
+        round_structure = Round.from_arrays(
+            round_obj.number, white_ids, black_ids, game_results, knockout_stage
+        )
+        matches = round_structure.matches
 
         # Add byes for players that didn't play (Swiss only)
-        if format_type == TournamentFormat.SWISS:
-            players_that_played = set()
-            for match in matches:
-                players_that_played.add(match.competitor1_id)
-                players_that_played.add(match.competitor2_id)
-
-            byes = {
-                b.player_id: b
-                for b in PlayerBye.objects.filter(round=round_obj)
-            }
-
-            for player_id in players:
-                if player_id not in players_that_played:
-                    bye = byes.get(player_id)
-                    if bye:
-                        gp = bye.score()  # 0, 0.5, or 1
-                    else:
-                        gp = 0.0  # no pairing, no bye record → 0 pts
-
-                    mp = 2 if gp >= 1.0 else (1 if gp > 0 else 0)
-                    matches.append(create_scored_bye_match(player_id, gp, mp))
+        unpaired_player_ids = (
+            players_set.difference(players_that_played)
+            if format_type == TournamentFormat.SWISS
+            else ()
+        )
+        if unpaired_player_ids:
+            byes = byes_by_round.get(round_obj.id, {})
+
+            # A bye record scores 0, 0.5 or 1; no pairing and no bye record
+            # scores 0 pts
+            bye_points = [
+                (player_id, byes[player_id].score() if player_id in byes else 0.0)
+                for player_id in unpaired_player_ids
+            ]
+            matches.extend(
+                create_scored_bye_match(
+                    player_id, gp, 2 if gp >= 1.0 else (1 if gp > 0 else 0)
+                )
+                for player_id, gp in bye_points
+            )
 
-        if matches:
-            knockout_stage = round_obj.knockout_stage if format_type == TournamentFormat.KNOCKOUT else None
-            rounds.append(Round(round_obj.number, matches, knockout_stage))
+        round_entries.append((round_obj, round_structure if matches else None))
+
+    rounds = _collect_rounds(
+        round_entries,
+        group_multi_match_rounds,
+        season.league.knockout_games_per_match or 1,
+    )
 
     # Create the tournament with appropriate format
-    return Tournament(players, rounds, STANDARD_SCORING, format_type)
+    return Tournament(players, rounds, scoring, format_type)
 
 
 def season_to_tournament_structure(
@@ -351,7 +497,8 @@ def season_to_tournament_structure(
     """Convert any season (team or individual) to tournament_core structure.
 
     This is the main entry point for converting database models to the clean
-    tournament structure used for calculations.
+    tournament structure used for calculations. Batch callers should load
+    seasons with select_related("league"), which every builder reads.
 
     Args:
         season: A Season model instance from the database
@@ -361,15 +508,8 @@ def season_to_tournament_structure(
         Tournament object with all rounds, matches, and games
     """
     if season.league.is_team_league():
-        tournament = team_tournament_to_structure(season)
-    else:
-        tournament = lone_tournament_to_structure(season)
-
-    # Override scoring if provided
-    if scoring:
-        tournament.scoring = scoring
-
-    return tournament
+        return team_tournament_to_structure(season, scoring)
+    return lone_tournament_to_structure(season, scoring)
 
 
 def knockout_bracket_to_structure(knockout_bracket) -> Tournament:
@@ -418,8 +558,8 @@ def knockout_bracket_to_structure(knockout_bracket) -> Tournament:
 def multi_match_knockout_to_structure(season) -> Tournament:
     """Convert a multi-match knockout tournament to tournament_core structure.
     
-    This function handles the aggregation of multiple rounds with the same 
-    pairings for multi-match knockout tournaments.
+    Rounds that share a knockout_multi_round_group are aggregated into a
+    single round while the structure is built.
     
     Args:
         season: Season object for multi-match knockout tournament
@@ -429,65 +569,70 @@ def multi_match_knockout_to_structure(season) -> Tournament:
     """
     if season.league.pairing_type != 'knockout-multi':
         raise ValueError(f"Season {season} is not a multi-match knockout tournament")
-    
-    # Get base tournament structure
-    tournament = season_to_tournament_structure(season)
+
+    if season.league.is_team_league():
+        return team_tournament_to_structure(season, group_multi_match_rounds=True)
+    return lone_tournament_to_structure(season, group_multi_match_rounds=True)
+
+
+def _collect_rounds(round_entries, group_multi_match_rounds, games_per_match):
+    """Return the rounds to include in a tournament structure.
+
+    round_entries is a list of (round_obj, Round or None) pairs in round order,
+    where None marks a completed round without any matches.
+    """
+    if not group_multi_match_rounds:
+        return [
+            round_structure for _, round_structure in round_entries if round_structure
+        ]
 
     # Group rounds by knockout_multi_round_group
     round_groups = defaultdict(list)
-    
-    for round_obj in season.round_set.filter(is_completed=True).order_by("number"):
+    for round_obj, round_structure in round_entries:
         group_id = round_obj.knockout_multi_round_group or f"single_{round_obj.number}"
-        round_groups[group_id].append(round_obj)
-    
-    # Rebuild tournament with aggregated matches
+        round_groups[group_id].append((round_obj, round_structure))
+
     aggregated_rounds = []
-    
-    for group_id, group_rounds in round_groups.items():
-        if len(group_rounds) == 1:
+    for group_entries in round_groups.values():
+        if len(group_entries) == 1:
             # Single round - use as is
-            round_obj = group_rounds[0]
-            existing_round = next(
-                (r for r in tournament.rounds if r.number == round_obj.number), 
-                None
-            )
-            if existing_round:
-                aggregated_rounds.append(existing_round)
+            round_structure = group_entries[0][1]
+            if round_structure:
+                aggregated_rounds.append(round_structure)
         else:
             # Multiple rounds - aggregate them
-            aggregated_round = _aggregate_multi_match_rounds(group_rounds, tournament, season)
-            aggregated_rounds.append(aggregated_round)
-    
+            aggregated_rounds.append(
+                _aggregate_multi_match_rounds(group_entries, games_per_match)
+            )
+
     # Sort rounds by number
-    aggregated_rounds.sort(key=lambda r: r.number)
-    
-    # Create new tournament with aggregated rounds
-    return Tournament(
-        competitors=tournament.competitors,
-        rounds=aggregated_rounds,
-        scoring=tournament.scoring,
-        format=TournamentFormat.KNOCKOUT
-    )
+    aggregated_rounds.sort(key=attrgetter("number"))
+    return aggregated_rounds
+
+
+def _pairing_key(match):
+    """Return a key identifying a match's pairing regardless of colors."""
+    c1, c2 = match.competitor1_id, match.competitor2_id
+    return (c1, c2) if c1 <= c2 else (c2, c1)
 
 
-def _aggregate_multi_match_rounds(group_rounds, base_tournament, season):
-    """Aggregate multiple rounds with same pairings into single round structure."""
+def _aggregate_multi_match_rounds(group_entries, games_per_match):
+    """Aggregate multiple rounds with same pairings into single round structure.
+
+    group_entries is a list of (round_obj, Round or None) pairs for the group.
+    """
     # Use the first round as the base
-    base_round = min(group_rounds, key=lambda r: r.number)
+    base_round = min(
+        (round_obj for round_obj, _ in group_entries), key=attrgetter("number")
+    )
     
     # Group pairings by teams
     pairing_groups = defaultdict(list)
     
-    for round_obj in group_rounds:
-        round_structure = next(
-            (r for r in base_tournament.rounds if r.number == round_obj.number),
-            None
-        )
+    for _, round_structure in group_entries:
         if round_structure:
             for match in round_structure.matches:
-                # Create a key for this pairing
-                key = tuple(sorted([match.competitor1_id, match.competitor2_id]))
-                pairing_groups[key].append(match)
+                pairing_groups[_pairing_key(match)].append(match)
     
     # Create aggregated matches
     aggregated_matches = []
@@ -501,25 +646,29 @@ def _aggregate_multi_match_rounds(group_rounds, base_tournament, season):
                 competitor2_id=match.competitor2_id,
                 games=match.games,
                 is_bye=match.is_bye,
-                games_per_match=season.league.knockout_games_per_match or len(matches),
+                games_per_match=games_per_match,
                 manual_tiebreak_value=match.manual_tiebreak_value
             )
             aggregated_matches.append(aggregated_match)
         else:
             # Multiple matches - aggregate games
-            all_games = []
-            manual_tiebreak = None
+            all_games = list(chain.from_iterable(match.games for match in matches))
+
+            # The latest match's manual tiebreak decides
+            manual_tiebreak = next(
+                (
+                    match.manual_tiebreak_value
+                    for match in reversed(matches)
+                    if match.manual_tiebreak_value is not None
+                ),
+                None,
+            )
             
             # Ensure consistent competitor ordering
             first_match = matches[0]
             competitor1_id = first_match.competitor1_id
             competitor2_id = first_match.competitor2_id
             
-            for match in matches:
-                all_games.extend(match.games)
-                if match.manual_tiebreak_value is not None:
-                    manual_tiebreak = match.manual_tiebreak_value
-            
             aggregated_match = Match(
                 competitor1_id=competitor1_id,
                 competitor2_id=competitor2_id,
@@ -593,10 +742,7 @@ def update_multi_match_progress_from_tournament(tournament, bracket):
             
         # Calculate stage status
         # Use the actual unique pairs, not the division logic
-        total_pairs = len(set(
-            tuple(sorted([match.competitor1_id, match.competitor2_id])) 
-            for match in round_obj.matches
-        ))
+        total_pairs = len({_pairing_key(match) for match in round_obj.matches})
         if total_pairs == 0:
             continue
             
@@ -1,9 +1,9 @@
-from datetime import timedelta, datetime
+from datetime import timedelta
 
-from ckeditor_uploader.widgets import CKEditorUploadingWidget
 from django import forms
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Max
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.formfields import SplitPhoneNumberField
@@ -13,21 +13,21 @@ from heltour import gdpr
 from heltour.tournament.models import (
     ALTERNATE_PREFERENCE_OPTIONS,
     PLAYER_NOTIFICATION_TYPES,
-    GameNomination,
     InviteCode,
     ModRequest,
     PlayerNotificationSetting,
     Registration,
     RegistrationMode,
-    Season,
     SeasonPlayer,
-    Section,
     Team,
     TeamMember,
     normalize_gamelink,
     username_validator,
 )
-from heltour.tournament.workflows import ApproveRegistrationWorkflow
+from heltour.tournament.workflows import (
+    ApproveRegistrationWorkflow,
+    add_player_to_team,
+)
 
 YES_NO_OPTIONS = (
     (
@@ -40,6 +40,44 @@ YES_NO_OPTIONS = (
     ),
 )
 
+# League-independent consent texts, translated lazily once at import
+_TOS_LABEL = _(gdpr.AGREED_TO_TOS_LABEL)
+_TOS_HELP_TEXT = _(gdpr.AGREED_TO_TOS_HELP_TEXT)
+_MISSING_CONSENT_MESSAGE = _(gdpr.MISSING_CONSENT_MESSAGE)
+
+# Registration fields that must be answered "Yes"
+_CONSENT_FIELDS = ("agreed_to_tos", "agreed_to_rules", "can_commit")
+
+# Bootstrap toggle attributes for the weeks unavailable checkboxes; widgets
+# copy their attrs, so the dict is shared safely
+_WEEKS_TOGGLE_ATTRS = {
+    "data-toggle": "toggle",
+    "data-on": "Unavailable",
+    "data-off": "Available",
+    "data-onstyle": "default",
+    "data-offstyle": "success",
+    "data-size": "small",
+}
+
+# New registrations' date of birth defaults to this long ago
+_DEFAULT_AGE = timedelta(days=365 * 18)
+
+
+def _coerce_yes(value):
+    return value == "True"
+
+
+def _yes_no_radio(label, help_text=""):
+    """Return a required Yes/No radio field that cleans to a bool."""
+    return forms.TypedChoiceField(
+        required=True,
+        label=label,
+        help_text=help_text,
+        choices=YES_NO_OPTIONS,
+        widget=forms.RadioSelect,
+        coerce=_coerce_yes,
+    )
+
 
 class RegistrationForm(forms.ModelForm):
     # Override contact_number to use SplitPhoneNumberField
@@ -94,14 +132,21 @@ class RegistrationForm(forms.ModelForm):
             "fide_id": _("Your FIDE player ID if you have one"),
         }
 
-    def __init__(self, *args, rules_url="", **kwargs):
+    def __init__(self, *args, rules_url="", already_accepted=None, **kwargs):
         self.season = kwargs.pop("season")
 
         self.player = kwargs.pop("player")
-
-        already_accepted = SeasonPlayer.objects.filter(
-            season__in=self.season.section_list(), player=self.player
-        ).exists()
+        # Set by clean_invite_code() for invite-only leagues
+        self.invite_code_obj = None
+
+        # Evaluated once here and reused for the section preference choices
+        section_list = list(self.season.section_list())
+        # Callers that already know whether the player was accepted into the
+        # season can pass it to skip the lookup
+        if already_accepted is None:
+            already_accepted = SeasonPlayer.objects.filter(
+                season__in=section_list, player=self.player
+            ).exists()
 
         league = self.season.league
         super(RegistrationForm, self).__init__(*args, **kwargs)
@@ -138,8 +183,9 @@ class RegistrationForm(forms.ModelForm):
             self.fields["date_of_birth"].required = True
             # Set default date of birth to 18 years ago
             if not self.instance.pk:  # Only for new registrations
-                eighteen_years_ago = datetime.now().date() - timedelta(days=365 * 18)
-                self.fields["date_of_birth"].initial = eighteen_years_ago
+                self.fields["date_of_birth"].initial = (
+                    timezone.localdate() - _DEFAULT_AGE
+                )
         else:
             del self.fields["date_of_birth"]
 
@@ -197,28 +243,11 @@ class RegistrationForm(forms.ModelForm):
                     "required": _("Invite code is required for this league")
                 },
             )
-            # Field order with invite code at the beginning, then name fields if present
-            priority_fields = ["invite_code"]
-            if "first_name" in self.fields:
-                priority_fields.append("first_name")
-            if "last_name" in self.fields:
-                priority_fields.append("last_name")
-            field_order = priority_fields + [
-                f for f in self.fields if f not in priority_fields
-            ]
-            self.order_fields(field_order)
-        else:
-            # Field order with name fields at the beginning if present
-            priority_fields = []
-            if "first_name" in self.fields:
-                priority_fields.append("first_name")
-            if "last_name" in self.fields:
-                priority_fields.append("last_name")
-            if priority_fields:
-                field_order = priority_fields + [
-                    f for f in self.fields if f not in priority_fields
-                ]
-                self.order_fields(field_order)
+
+        # Field order with the invite code at the beginning, then name fields if
+        # present; order_fields() skips absent fields and keeps the rest in order
+        if "invite_code" in self.fields or "first_name" in self.fields:
+            self.order_fields(["invite_code", "first_name", "last_name"])
 
         # Rating fields
         # 20 games - remove if provisional warnings are disabled
@@ -289,22 +318,10 @@ class RegistrationForm(forms.ModelForm):
         if not league_name.endswith("League"):
             league_name += " League"
 
-        self.fields["agreed_to_tos"] = forms.TypedChoiceField(
-            required=True,
-            label=_(gdpr.AGREED_TO_TOS_LABEL),
-            help_text=_(gdpr.AGREED_TO_TOS_HELP_TEXT),
-            choices=YES_NO_OPTIONS,
-            widget=forms.RadioSelect,
-            coerce=lambda x: x == "True",
-        )
+        self.fields["agreed_to_tos"] = _yes_no_radio(_TOS_LABEL, _TOS_HELP_TEXT)
 
-        self.fields["agreed_to_rules"] = forms.TypedChoiceField(
-            required=True,
-            label=_(gdpr.AGREED_TO_RULES_LABEL % league_name),
-            help_text=rules_help_text,
-            choices=YES_NO_OPTIONS,
-            widget=forms.RadioSelect,
-            coerce=lambda x: x == "True",
+        self.fields["agreed_to_rules"] = _yes_no_radio(
+            _(gdpr.AGREED_TO_RULES_LABEL % league_name), rules_help_text
         )
 
         # Alternate preference
@@ -336,10 +353,12 @@ class RegistrationForm(forms.ModelForm):
         else:
             del self.fields["alternate_preference"]
 
-        section_list = self.season.section_list()
         if len(section_list) > 1:
+            self._sections_by_id = {s.section.id: s.section for s in section_list}
             section_options = [("", "No preference (use my rating)")]
-            section_options += [(s.section.id, s.section.name) for s in section_list]
+            section_options += [
+                (section.id, section.name) for section in self._sections_by_id.values()
+            ]
             self.fields["section_preference"] = forms.ChoiceField(
                 required=False,
                 choices=section_options,
@@ -361,37 +380,31 @@ class RegistrationForm(forms.ModelForm):
         ):
             weeks = [
                 (
-                    r.number,
+                    number,
                     "Round %s (%s - %s)"
                     % (
-                        r.number,
+                        number,
                         (
-                            r.start_date.strftime("%b %-d")
-                            if r.start_date is not None
+                            start_date.strftime("%b %-d")
+                            if start_date is not None
                             else "?"
                         ),
                         (
-                            r.end_date.strftime("%b %-d")
-                            if r.end_date is not None
+                            end_date.strftime("%b %-d")
+                            if end_date is not None
                             else "?"
                         ),
                     ),
                 )
-                for r in self.season.round_set.order_by("number")
+                for number, start_date, end_date in self.season.round_set.order_by(
+                    "number"
+                ).values_list("number", "start_date", "end_date")
             ]
-            toggle_attrs = {
-                "data-toggle": "toggle",
-                "data-on": "Unavailable",
-                "data-off": "Available",
-                "data-onstyle": "default",
-                "data-offstyle": "success",
-                "data-size": "small",
-            }
             self.fields["weeks_unavailable"] = forms.MultipleChoiceField(
                 required=False,
                 label=_("Indicate any rounds you would not be able to play."),
                 choices=weeks,
-                widget=forms.CheckboxSelectMultiple(attrs=toggle_attrs),
+                widget=forms.CheckboxSelectMultiple(attrs=_WEEKS_TOGGLE_ATTRS),
             )
         else:
             del self.fields["weeks_unavailable"]
@@ -402,7 +415,7 @@ class RegistrationForm(forms.ModelForm):
         registration.player = self.player
 
         # Handle invite code for invite-only leagues
-        if hasattr(self, "invite_code_obj") and self.invite_code_obj:
+        if self.invite_code_obj:
             registration.invite_code_used = self.invite_code_obj
 
         is_new = registration.pk is None
@@ -415,7 +428,6 @@ class RegistrationForm(forms.ModelForm):
         # Auto-approve registrations with valid invite codes
         should_auto_approve = (
             is_new
-            and hasattr(self, "invite_code_obj")
             and self.invite_code_obj
             and self.season.league.registration_mode == RegistrationMode.INVITE_ONLY
         )
@@ -430,49 +442,47 @@ class RegistrationForm(forms.ModelForm):
             registration.status = "pending"
 
         if commit:
-            registration.save()
-            # Mark the invite code as used after saving the registration
-            if hasattr(self, "invite_code_obj") and self.invite_code_obj:
-                self.invite_code_obj.mark_used(self.player)
-
-                # Handle auto-approval for invite codes
-                if should_auto_approve and self.invite_code_obj:
-                    from heltour.tournament.models import SeasonPlayer, TeamMember
-                    from heltour.tournament.workflows import add_player_to_team
-
-                    # Create or update SeasonPlayer for both captain and team member codes
-                    sp, created = SeasonPlayer.objects.update_or_create(
-                        player=self.player,
-                        season=self.season,
-                        defaults={"registration": registration, "is_active": True},
-                    )
-
-                    # Only handle team assignment for team_member codes
-                    if (
-                        self.invite_code_obj.code_type == "team_member"
-                        and self.invite_code_obj.team
-                    ):
-                        existing_member = TeamMember.objects.filter(
-                            player=self.player, team__season=self.season
-                        ).first()
-
-                        if not existing_member:
-                            # Add player to existing team
-                            add_player_to_team(self.player, self.invite_code_obj.team)
-                    # For captain codes, we auto-approve but don't create the team yet - they need to complete setup first
+            with transaction.atomic():
+                self._save_with_invite_code(registration, should_auto_approve)
 
         registration.player.agreed_to_tos()
         return registration
 
+    def _save_with_invite_code(self, registration, should_auto_approve):
+        registration.save()
+        # Mark the invite code as used after saving the registration
+        if not self.invite_code_obj:
+            return
+        self.invite_code_obj.mark_used(self.player)
+
+        # Handle auto-approval for invite codes
+        if not should_auto_approve:
+            return
+
+        # Create or update SeasonPlayer for both captain and team member codes
+        SeasonPlayer.objects.update_or_create(
+            player=self.player,
+            season=self.season,
+            defaults={"registration": registration, "is_active": True},
+        )
+
+        # Only handle team assignment for team_member codes
+        # For captain codes, we auto-approve but don't create the team yet - they need to complete setup first
+        if (
+            self.invite_code_obj.code_type == "team_member"
+            and self.invite_code_obj.team
+            and not TeamMember.objects.filter(
+                player=self.player, team__season=self.season
+            ).exists()
+        ):
+            # Add player to existing team
+            add_player_to_team(self.player, self.invite_code_obj.team)
+
     def clean(self):
         cd = super().clean()
-        for field_name in [
-            "agreed_to_tos",
-            "agreed_to_rules",
-            "can_commit",
-        ]:
+        for field_name in _CONSENT_FIELDS:
             if not cd.get(field_name, False):
-                self.add_error(field_name, _(gdpr.MISSING_CONSENT_MESSAGE))
+                self.add_error(field_name, _MISSING_CONSENT_MESSAGE)
         return cd
 
     def clean_invite_code(self):
@@ -502,26 +512,20 @@ class RegistrationForm(forms.ModelForm):
         if "weeks_unavailable" not in self.fields:
             return ""
 
-        upcoming_rounds = [
-            r
-            for r in self.season.round_set.order_by("number")
-            if r.start_date and r.start_date > timezone.now()
+        weeks_unavailable = self.cleaned_data["weeks_unavailable"]
+        upcoming_round_numbers = [
+            str(number)
+            for number in self.season.round_set.filter(
+                start_date__gt=timezone.now()
+            ).values_list("number", flat=True)
         ]
-        upcoming_rounds_available = [
-            r
-            for r in upcoming_rounds
-            if str(r.number) not in self.cleaned_data["weeks_unavailable"]
-        ]
-        upcoming_rounds_unavailable = [
-            r
-            for r in upcoming_rounds
-            if str(r.number) in self.cleaned_data["weeks_unavailable"]
-        ]
-        if len(upcoming_rounds_available) == 0 and len(upcoming_rounds_unavailable) > 0:
+        if upcoming_round_numbers and set(weeks_unavailable).issuperset(
+            upcoming_round_numbers
+        ):
             raise ValidationError(
                 "You can't mark yourself as unavailable for all upcoming rounds."
             )
-        return ",".join(self.cleaned_data["weeks_unavailable"])
+        return ",".join(weeks_unavailable)
 
     def clean_section_preference(self):
         # If the field was deleted from the form, skip validation
@@ -530,7 +534,8 @@ class RegistrationForm(forms.ModelForm):
 
         if self.cleaned_data["section_preference"] == "":
             return None
-        return Section.objects.get(pk=int(self.cleaned_data["section_preference"]))
+        # The choices only allow IDs of the sections listed in __init__
+        return self._sections_by_id[int(self.cleaned_data["section_preference"])]
 
 
 class ReviewRegistrationForm(forms.Form):
@@ -552,6 +557,7 @@ class ApproveRegistrationForm(forms.Form):
 
         section_list = reg.season.section_list()
         if len(section_list) > 1:
+            self._seasons_by_id = {season.id: season for season in section_list}
             section_options = [
                 (season.id, season.section.name) for season in section_list
             ]
@@ -568,7 +574,8 @@ class ApproveRegistrationForm(forms.Form):
             )
 
     def clean_section(self):
-        return Season.objects.get(pk=int(self.cleaned_data["section"]))
+        # The choices only allow IDs of the seasons listed in __init__
+        return self._seasons_by_id[int(self.cleaned_data["section"])]
 
 
 class RejectRegistrationForm(forms.Form):
@@ -720,9 +727,11 @@ class NominateForm(forms.Form):
                 "You've reached the nomination limit. Delete one before nominating again.",
                 code="invalid",
             )
-        if GameNomination.objects.filter(
-            season=self.season, nominating_player=self.player, game_link=game_link
-        ).exists():
+        # current_nominations holds all of the player's nominations this season
+        if any(
+            nomination.game_link == game_link
+            for nomination in self.current_nominations
+        ):
             raise ValidationError("You have already nominated this game.")
         self.pairing = self.season_pairings.filter(game_link=game_link).first()
         if self.pairing is None:
@@ -754,16 +763,20 @@ class ContactForm(forms.Form):
 
 class BulkEmailForm(forms.Form):
     subject = forms.CharField(max_length=140)
-    html_content = forms.CharField(
-        max_length=4096, required=True, widget=CKEditorUploadingWidget()
-    )
+    html_content = forms.CharField(max_length=4096, required=True)
     text_content = forms.CharField(
         max_length=4096, required=True, widget=forms.Textarea
     )
     confirm_send = forms.BooleanField()
 
     def __init__(self, player_count, *args, **kwargs):
+        # Only load the CKEditor uploader when a bulk email form is built
+        from ckeditor_uploader.widgets import CKEditorUploadingWidget
+
         super(BulkEmailForm, self).__init__(*args, **kwargs)
+        self.fields["html_content"] = forms.CharField(
+            max_length=4096, required=True, widget=CKEditorUploadingWidget()
+        )
 
         self.fields["confirm_send"].label = (
             "Yes, I'm sure - send emails to %d players" % (player_count)
@@ -774,12 +787,13 @@ class TeamSpamForm(forms.Form):
     text = forms.CharField(max_length=4096, required=True, widget=forms.Textarea)
     confirm_send = forms.BooleanField()
 
-    def __init__(self, season, *args, **kwargs):
+    def __init__(self, season, *args, team_count=None, **kwargs):
         super(TeamSpamForm, self).__init__(*args, **kwargs)
 
+        if team_count is None:
+            team_count = season.team_set.count()
         self.fields["confirm_send"].label = (
-            "Yes, I'm sure - send spam to %d teams in %s"
-            % (season.team_set.count(), season.name)
+            "Yes, I'm sure - send spam to %d teams in %s" % (team_count, season.name)
         )
 
 
@@ -814,12 +828,24 @@ class TvTimezoneForm(forms.Form):
 class NotificationsForm(forms.Form):
     def __init__(self, league, player, *args, **kwargs):
         super(NotificationsForm, self).__init__(*args, **kwargs)
+        # Fetch all of the player's saved settings for the league at once
+        settings_by_type = {
+            setting.type: setting
+            for setting in PlayerNotificationSetting.objects.filter(
+                player=player, league=league
+            )
+        }
         for type_, _ in PLAYER_NOTIFICATION_TYPES:
-            setting = PlayerNotificationSetting.get_or_default(
+            setting = settings_by_type.get(type_) or PlayerNotificationSetting.default(
                 player=player, league=league, type=type_
             )
+            # users cannot switch off lichess messages for started games, as the bulk api requires us to send those
+            is_game_started_type = type_ == "game_started"
             self.fields[type_ + "_lichess"] = forms.BooleanField(
-                required=False, label="Lichess", initial=setting.enable_lichess_mail
+                required=False,
+                label="Lichess",
+                initial=is_game_started_type,
+                disabled=is_game_started_type,
             )
             self.fields[type_ + "_slack"] = forms.BooleanField(
                 required=False, label="Slack", initial=setting.enable_slack_im
@@ -833,14 +859,6 @@ class NotificationsForm(forms.Form):
                 initial=is_round_started_type or setting.enable_slack_mpim,
                 disabled=is_round_started_type,
             )
-            # users cannot switch off lichess messages for started games, as the bulk api requires us to send those
-            is_game_started_type = type_ == "game_started"
-            self.fields[type_ + "_lichess"] = forms.BooleanField(
-                required=False,
-                label="Lichess",
-                initial=is_game_started_type,
-                disabled=is_game_started_type,
-            )
             if type_ == "before_game_time":
                 offset_options = [
                     (5, "5 minutes"),
@@ -922,22 +940,23 @@ class GenerateTeamInviteCodeForm(forms.Form):
 
         if self.player and not hasattr(self, "skip_limit_check"):
             # Check if captain hasn't exceeded their limit
+            limit = self.season.codes_per_captain_limit
             existing_codes = InviteCode.objects.filter(
-                season=self.season, created_by_captain=self.player
+                season_id=self.season.pk, created_by_captain_id=self.player.pk
             ).count()
 
             requested_count = cleaned_data.get("count", 0)
 
-            if existing_codes + requested_count > self.season.codes_per_captain_limit:
-                remaining = self.season.codes_per_captain_limit - existing_codes
+            if existing_codes + requested_count > limit:
+                remaining = limit - existing_codes
                 if remaining == 0:
                     raise forms.ValidationError(
-                        f"You have reached your limit of {self.season.codes_per_captain_limit} invite codes."
+                        f"You have reached your limit of {limit} invite codes."
                     )
                 else:
                     raise forms.ValidationError(
                         f'You can only create {remaining} more invite code{"s" if remaining != 1 else ""}. '
-                        f"You have created {existing_codes} out of {self.season.codes_per_captain_limit} allowed."
+                        f"You have created {existing_codes} out of {limit} allowed."
                     )
 
         return cleaned_data
@@ -945,11 +964,10 @@ class GenerateTeamInviteCodeForm(forms.Form):
     def save(self, created_by):
         """Generate the invite codes"""
         count = self.cleaned_data["count"]
-        codes = []
-
-        for _ in range(count):
-            code = InviteCode(
-                league=self.team.season.league,
+        league = self.team.season.league
+        codes = [
+            InviteCode(
+                league=league,
                 season=self.season,
                 code=InviteCode.generate_code(),
                 code_type="team_member",
@@ -958,15 +976,9 @@ class GenerateTeamInviteCodeForm(forms.Form):
                 created_by_captain=self.player if self.player else None,
                 notes=f"Created for team {self.team.name}",
             )
-
-            # Ensure unique code
-            while InviteCode.objects.filter(code=code.code).exists():
-                code.code = InviteCode.generate_code()
-
-            code.save()
-            codes.append(code)
-
-        return codes
+            for _ in range(count)
+        ]
+        return InviteCode.bulk_create_unique(codes)
 
 
 class TeamCreateForm(forms.Form):
@@ -1017,13 +1029,13 @@ class TeamCreateForm(forms.Form):
         return name
 
     def save(self):
-        # Get the next available team number
-        existing_numbers = Team.objects.filter(season=self.season).values_list(
-            "number", flat=True
-        )
-        team_number = 1
-        while team_number in existing_numbers:
-            team_number += 1
+        # Number the team after the season's highest team number
+        team_number = (
+            Team.objects.filter(season=self.season).aggregate(Max("number"))[
+                "number__max"
+            ]
+            or 0
+        ) + 1
 
         # Create the team
         team = Team.objects.create(
@@ -1073,7 +1085,7 @@ class TeamNameEditForm(forms.Form):
         # Check if another team has this name (only if name changed)
         if (
             name != self.team.name
-            and Team.objects.filter(season=self.team.season, name=name).exists()
+            and Team.objects.filter(season_id=self.team.season_id, name=name).exists()
         ):
             raise forms.ValidationError("A team with this name already exists")
         return name
@@ -1098,9 +1110,14 @@ class BoardOrderForm(forms.Form):
         team_members = self.team.teammember_set.select_related("player").order_by(
             "board_number"
         )
+        # Kept for clean() and save(), so the members aren't fetched again one
+        # by one and field names don't have to be parsed back into player ids
+        self._members_by_field = {}
 
         for member in team_members:
-            self.fields[f"player_{member.player.id}"] = forms.IntegerField(
+            field_name = f"player_{member.player_id}"
+            self._members_by_field[field_name] = member
+            self.fields[field_name] = forms.IntegerField(
                 min_value=1,
                 initial=member.board_number,
                 label=member.player.lichess_username,
@@ -1121,10 +1138,11 @@ class BoardOrderForm(forms.Form):
                 )
 
         # Collect all board numbers
-        board_numbers = []
-        for field_name, value in cleaned_data.items():
-            if field_name.startswith("player_") and value is not None:
-                board_numbers.append(value)
+        board_numbers = [
+            cleaned_data[field_name]
+            for field_name in self._members_by_field
+            if cleaned_data.get(field_name) is not None
+        ]
 
         # Only validate if we have board numbers
         if board_numbers:
@@ -1139,12 +1157,10 @@ class BoardOrderForm(forms.Form):
         with transaction.atomic():
             # First, collect all the changes
             updates = []
-            for field_name, board_number in self.cleaned_data.items():
-                if field_name.startswith("player_"):
-                    player_id = int(field_name.replace("player_", ""))
-                    member = self.team.teammember_set.get(player_id=player_id)
-                    if member.board_number != board_number:
-                        updates.append((member, board_number))
+            for field_name, member in self._members_by_field.items():
+                board_number = self.cleaned_data[field_name]
+                if member.board_number != board_number:
+                    updates.append((member, board_number))
 
             if not updates:
                 return  # No changes to make
@@ -1154,12 +1170,22 @@ class BoardOrderForm(forms.Form):
             max_board = self.team.season.boards
             temp_start = max_board + 100
 
+            # Each step is a single UPDATE; bulk_update() skips TeamMember.save(),
+            # so date_modified is set here and the team is saved once at the end
+            members = [member for member, _ in updates]
+            now = timezone.now()
+
             # Step 1: Move all changing members to temporary high board numbers
-            for i, (member, _) in enumerate(updates):
+            for i, member in enumerate(members):
                 member.board_number = temp_start + i
-                member.save()
+                member.date_modified = now
+            TeamMember.objects.bulk_update(members, ["board_number", "date_modified"])
 
             # Step 2: Now set the actual new board numbers
             for member, new_board_number in updates:
                 member.board_number = new_board_number
-                member.save()
+            TeamMember.objects.bulk_update(members, ["board_number"])
+
+            # Add a corresponding entry to the team's history, as
+            # TeamMember.save() does
+            self.team.save()
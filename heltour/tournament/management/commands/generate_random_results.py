@@ -6,6 +6,7 @@ in the current round that don't already have results.
 """
 
 import random
+from operator import attrgetter
 from django.core.management.base import BaseCommand, CommandError
 
 from heltour.tournament.models import (
@@ -14,6 +15,7 @@ from heltour.tournament.models import (
     LonePlayerPairing,
 )
 from heltour.tournament.builder import simulate_game_result
+from heltour.tournament_core.elo import elo_expected
 
 
 class Command(BaseCommand):
@@ -248,7 +250,11 @@ class Command(BaseCommand):
             # Skip bye pairings in knockout
             if is_knockout and team_pairing.black_team_id is None:
                 continue
-            board_pairings = team_pairing.teamplayerpairing_set.order_by("board_number")
+            # Sort the prefetched boards in Python; order_by() would re-query
+            board_pairings = sorted(
+                team_pairing.teamplayerpairing_set.all(),
+                key=attrgetter("board_number"),
+            )
 
             pairing_results = []
             boards_processed = 0
@@ -569,8 +575,7 @@ class Command(BaseCommand):
             else:
                 return "0F-1X"  # White forfeits
 
-        # Calculate expected score using Elo formula
-        exp_white = 1 / (1 + 10 ** ((black_rating - white_rating) / 400))
+        exp_white = elo_expected(white_rating, black_rating)
 
         # Force decisive result (no draws in knockout)
         rand = random.random()
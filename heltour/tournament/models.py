@@ -1,7 +1,8 @@
 from __future__ import annotations
 import logging
 import re
-from collections import namedtuple
+import secrets
+from collections import defaultdict, namedtuple
 from collections.abc import Callable
 from typing import ClassVar
 from datetime import datetime, timedelta
@@ -13,7 +14,7 @@ from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator, RegexValidator
-from django.db import connection, models, transaction
+from django.db import IntegrityError, connection, models, transaction
 from django.db.models import JSONField, Q
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -27,6 +28,8 @@ from heltour.tournament_core import tiebreaks
 
 logger = logging.getLogger(__name__)
 
+_code_random = secrets.SystemRandom()
+
 
 # Helper function to find an item in a list by its properties
 def find(lst, **prop_values):
@@ -978,13 +981,23 @@ class Season(_BaseModel):
                 score.save()
             return
 
+        # Fetch the pairings and byes of every completed round once, by round
+        pairings_by_round = defaultdict(list)
+        for pairing in LonePlayerPairing.objects.filter(
+            round__in=completed_rounds
+        ).nocache():
+            pairings_by_round[pairing.round_id].append(pairing)
+        byes_by_round = defaultdict(list)
+        for bye in PlayerBye.objects.filter(round__in=completed_rounds):
+            byes_by_round[bye.round_id].append(bye)
+
         # --- Points and perf rating via legacy accumulation ---
         seed_rating_dict = {sp.player_id: sp.seed_rating for sp in season_players}
         score_dict = {}
         last_round = None
         for round_ in completed_rounds:
-            pairings = round_.loneplayerpairing_set.all().nocache()
-            byes = PlayerBye.objects.filter(round=round_)
+            pairings = pairings_by_round[round_.id]
+            byes = byes_by_round[round_.id]
             for sp in season_players:
                 white_pairing = find(pairings, white_id=sp.player_id)
                 black_pairing = find(pairings, black_id=sp.player_id)
@@ -1034,7 +1047,11 @@ class Season(_BaseModel):
         )
 
         # --- Games with black: count from DB pairings ---
-        games_with_black_map = _count_games_with_black(completed_rounds)
+        games_with_black_map = _count_games_with_black(
+            pairing
+            for round_pairings in pairings_by_round.values()
+            for pairing in round_pairings
+        )
 
         # --- Write scores ---
         for score in player_scores:
@@ -1079,9 +1096,13 @@ class Season(_BaseModel):
     def section_list(self):
         if not hasattr(self, "section"):
             return [self]
-        return Season.objects.filter(
-            section__section_group_id=self.section.section_group_id
-        ).order_by("section__order")
+        return (
+            Season.objects.filter(
+                section__section_group_id=self.section.section_group_id
+            )
+            .select_related("section")
+            .order_by("section__order")
+        )
 
     def section_group_name(self):
         if not hasattr(self, "section"):
@@ -1131,25 +1152,22 @@ _LoneScoreState = namedtuple(
 )
 
 
-def _count_games_with_black(completed_rounds):
+def _count_games_with_black(pairings):
     """Count played games where each player had the black pieces.
 
     Accounts for ``colors_reversed`` on ``LonePlayerPairing``.
     Returns a dict mapping player_id → count.
     """
     counts: dict[int, int] = {}
-    for round_ in completed_rounds:
-        for pairing in round_.loneplayerpairing_set.select_related(
-            "white", "black"
-        ).all():
-            if not pairing.game_played():
-                continue
-            if pairing.colors_reversed:
-                if pairing.white_id:
-                    counts[pairing.white_id] = counts.get(pairing.white_id, 0) + 1
-            else:
-                if pairing.black_id:
-                    counts[pairing.black_id] = counts.get(pairing.black_id, 0) + 1
+    for pairing in pairings:
+        if not pairing.game_played():
+            continue
+        if pairing.colors_reversed:
+            if pairing.white_id:
+                counts[pairing.white_id] = counts.get(pairing.white_id, 0) + 1
+        else:
+            if pairing.black_id:
+                counts[pairing.black_id] = counts.get(pairing.black_id, 0) + 1
     return counts
 
 
@@ -2351,15 +2369,22 @@ class TeamPairing(_BaseModel):
         ):
             raise ValidationError("Round and team seasons must match")
 
-    def refresh_points(self):
+    def refresh_points(self, white_team_player_ids=None, black_team_player_ids=None):
         """Refresh team points using the same logic as tournament_core calculations.
 
         Uses the single source of truth for team pairing score calculation.
+        Callers refreshing many pairings can pass both teams' member player IDs
+        to save the member query.
         """
         from heltour.tournament.db_to_structure import calculate_team_pairing_scores
 
         self.white_points, self.black_points, self.white_wins, self.black_wins = (
-            calculate_team_pairing_scores(self)
+            calculate_team_pairing_scores(
+                self,
+                use_cache=False,
+                white_team_player_ids=white_team_player_ids,
+                black_team_player_ids=black_team_player_ids,
+            )
         )
 
     def white_points_display(self):
@@ -2939,48 +2964,59 @@ class InviteCode(_BaseModel):
     @classmethod
     def get_by_code(cls, code, league, season):
         """Get an invite code by its code value (case-insensitive)"""
+        # Codes are stored uppercase (see save()), so an exact match on the
+        # uppercased input can use the unique index, unlike code__iexact
         return cls.objects.filter(
-            league=league, season=season, code__iexact=code.strip()
+            league=league, season=season, code=code.strip().upper()
         ).first()
 
+    # Dictionary words for readability
+    CODE_WORDS: ClassVar[tuple[str, ...]] = (
+        "CHESS",
+        "KNIGHT",
+        "BISHOP",
+        "QUEEN",
+        "KING",
+        "ROOK",
+        "PAWN",
+        "CHECK",
+        "MATE",
+        "CASTLE",
+        "FORK",
+        "PIN",
+        "SKEWER",
+        "GAMBIT",
+        "ENDGAME",
+        "OPENING",
+        "TACTICS",
+        "BLITZ",
+        "RAPID",
+        "BULLET",
+    )
+    CODE_SUFFIX_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
     @classmethod
     def generate_code(cls):
         """Generate a cryptographically secure invite code"""
-        # Dictionary words for readability
-        words = [
-            "CHESS",
-            "KNIGHT",
-            "BISHOP",
-            "QUEEN",
-            "KING",
-            "ROOK",
-            "PAWN",
-            "CHECK",
-            "MATE",
-            "CASTLE",
-            "FORK",
-            "PIN",
-            "SKEWER",
-            "GAMBIT",
-            "ENDGAME",
-            "OPENING",
-            "TACTICS",
-            "BLITZ",
-            "RAPID",
-            "BULLET",
-        ]
-
         # Generate: WORD1-WORD2-XXXXXXXX
-        import random
-
-        word1 = random.choice(words)
-        word2 = random.choice([w for w in words if w != word1])
-        suffix = get_random_string(
-            8, allowed_chars="ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-        )
+        word1, word2 = _code_random.sample(cls.CODE_WORDS, 2)
+        suffix = get_random_string(8, allowed_chars=cls.CODE_SUFFIX_CHARS)
 
         return f"{word1}-{word2}-{suffix}"
 
+    @classmethod
+    def bulk_create_unique(cls, codes, max_attempts=3):
+        """Insert unsaved codes in one query, regenerating them on a collision"""
+        for attempt in range(max_attempts):
+            try:
+                with transaction.atomic():
+                    return cls.objects.bulk_create(codes)
+            except IntegrityError:
+                if attempt == max_attempts - 1:
+                    raise
+                for code in codes:
+                    code.code = cls.generate_code()
+
     @classmethod
     def create_batch(
         cls, league, season, count, created_by=None, code_type="captain", team=None
@@ -2989,34 +3025,27 @@ class InviteCode(_BaseModel):
         if count < 1 or count > 10000:
             raise ValidationError("Count must be between 1 and 10,000")
 
-        codes_to_create = []
-        attempts = 0
-        max_attempts = count * 10  # Allow for some collisions
-
-        while len(codes_to_create) < count and attempts < max_attempts:
-            attempts += 1
-            code = cls.generate_code()
-
-            # Check if code already exists
-            if not cls.objects.filter(code=code).exists():
-                codes_to_create.append(
-                    cls(
-                        league=league,
-                        season=season,
-                        code=code,
-                        code_type=code_type,
-                        team=team,
-                        created_by=created_by,
-                        notes=f"Batch created on {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    )
-                )
-
-        if len(codes_to_create) < count:
-            raise ValidationError(
-                f"Could only generate {len(codes_to_create)} unique codes"
-            )
+        # Codes only need to be distinct within the batch here; collisions with
+        # existing codes are caught by the unique constraint on insert
+        unique_codes = set()
+        while len(unique_codes) < count:
+            unique_codes.add(cls.generate_code())
 
-        return cls.objects.bulk_create(codes_to_create)
+        notes = f"Batch created on {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return cls.bulk_create_unique(
+            [
+                cls(
+                    league=league,
+                    season=season,
+                    code=code,
+                    code_type=code_type,
+                    team=team,
+                    created_by=created_by,
+                    notes=notes,
+                )
+                for code in unique_codes
+            ]
+        )
 
 
 # -------------------------------------------------------------------------------
@@ -4314,6 +4343,10 @@ class PlayerNotificationSetting(_BaseModel):
         obj = PlayerNotificationSetting.objects.filter(**kwargs).first()
         if obj is not None:
             return obj
+        return cls.default(**kwargs)
+
+    @classmethod
+    def default(cls, **kwargs):
         # Return (but don't create) the default setting based on the type
         obj = PlayerNotificationSetting(**kwargs)
         type_ = kwargs.get("type")
@@ -418,13 +418,14 @@ def reduce_variance_map(league):
 
 
 def get_best_league(player_data, boards, balance, count):
-    pool = Pool(getattr(settings, 'TEAMGEN_PROCESSES_NUMBER', 1))
     args = [(player_data, boards, balance) for _ in range(count)]
-    leagues = pool.map(make_league_map, args)
-    max_happiness = max([total_happiness(league['teams']) for league in leagues])
-    happy_leagues = [league for league in leagues if total_happiness(league['teams']) == max_happiness]
+    with Pool(getattr(settings, 'TEAMGEN_PROCESSES_NUMBER', 1)) as pool:
+        leagues = pool.map(make_league_map, args)
+        happiness = [total_happiness(league['teams']) for league in leagues]
+        max_happiness = max(happiness)
+        happy_leagues = [league for league, h in zip(leagues, happiness) if h == max_happiness]
 
-    happy_leagues = pool.map(reduce_variance_map, happy_leagues)
+        happy_leagues = pool.map(reduce_variance_map, happy_leagues)
 
     min_range_league = min(happy_leagues, key=lambda league: team_rating_range(league['teams']))
     return min_range_league
@@ -17,7 +17,10 @@ from heltour.tournament.models import (
     TeamMember,
 )
 from heltour.tournament.db_to_structure import (
+    _SCORE_MAP,
     _result_to_game_result,
+    calculate_team_pairing_scores,
+    multi_match_knockout_to_structure,
     team_tournament_to_structure,
     lone_tournament_to_structure,
     season_to_tournament_structure,
@@ -345,6 +348,137 @@ class DbToStructureTests(TestCase):
         self.assertEqual(len(tournament.rounds), 1)
         self.assertEqual(tournament.rounds[0].number, 1)
 
+    def test_team_pairing_without_boards_raises(self):
+        """A completed team pairing must have board pairings."""
+        league = League.objects.create(
+            name="Test Team League",
+            tag="TTL",
+            competitor_type="team",
+            rating_type="standard",
+        )
+        season = Season.objects.create(
+            league=league, name="Test Season", rounds=1, boards=2
+        )
+        team1 = Team.objects.create(season=season, name="Team 1", number=1)
+        team2 = Team.objects.create(season=season, name="Team 2", number=2)
+        round1 = Round.objects.create(season=season, number=1, is_completed=False)
+        TeamPairing.objects.create(
+            round=round1, white_team=team1, black_team=team2, pairing_order=1
+        )
+        Round.objects.filter(pk=round1.pk).update(is_completed=True)
+
+        with self.assertRaises(ValueError):
+            team_tournament_to_structure(season)
+
+    def test_calculate_team_pairing_scores_with_prefetched_member_ids(self):
+        """Pre-fetched member IDs give the same scores as the member query."""
+        from heltour.tournament.builder import TournamentBuilder
+
+        builder = (
+            TournamentBuilder()
+            .league("Test League", "TL", "team")
+            .season("TL", "Test Season", rounds=1, boards=2)
+            .team("Team 1", "team1_player1", "team1_player2")
+            .team("Team 2", "team2_player1", "team2_player2")
+            .round(1)
+            .match("Team 1", "Team 2", "1-0", "1/2-1/2")
+            .complete()
+            .build()
+        )
+        season = builder.current_season
+        team_pairing = TeamPairing.objects.get(round__season=season)
+
+        self.assertEqual(
+            calculate_team_pairing_scores(team_pairing),
+            calculate_team_pairing_scores(
+                team_pairing,
+                white_team_player_ids=set(
+                    team_pairing.white_team.teammember_set.values_list(
+                        "player_id", flat=True
+                    )
+                ),
+                black_team_player_ids=set(
+                    team_pairing.black_team.teammember_set.values_list(
+                        "player_id", flat=True
+                    )
+                ),
+            ),
+        )
+
+    def test_score_map_matches_pairing_scores(self):
+        """The board score table agrees with PlayerPairing's score methods."""
+        results = ["1-0", "0-1", "1/2-1/2", "1/2Z-1/2Z", "1X-0F", "0F-1X", "0F-0F"]
+        for result in results:
+            for colors_reversed in (False, True):
+                pairing = TeamPlayerPairing(
+                    result=result, colors_reversed=colors_reversed
+                )
+                self.assertEqual(
+                    _SCORE_MAP[(result, colors_reversed)],
+                    (pairing.white_score() or 0, pairing.black_score() or 0),
+                )
+
+    def test_multi_match_knockout_aggregates_grouped_rounds(self):
+        """Rounds in the same multi-match group become one aggregated round."""
+        league = League.objects.create(
+            name="Test Team League",
+            tag="TTL",
+            competitor_type="team",
+            rating_type="standard",
+            pairing_type="knockout-multi",
+        )
+        season = Season.objects.create(
+            league=league, name="Test Season", rounds=2, boards=2
+        )
+        team1 = Team.objects.create(season=season, name="Team 1", number=1)
+        team2 = Team.objects.create(season=season, name="Team 2", number=2)
+        players = []
+        for team in (team1, team2):
+            for board in (1, 2):
+                player = Player.objects.create(
+                    lichess_username=f"t{team.number}b{board}"
+                )
+                TeamMember.objects.create(
+                    team=team, player=player, board_number=board
+                )
+                players.append(player)
+
+        for number, white_team, black_team in ((1, team1, team2), (2, team2, team1)):
+            round_obj = Round.objects.get(season=season, number=number)
+            team_pairing = TeamPairing.objects.create(
+                round=round_obj,
+                white_team=white_team,
+                black_team=black_team,
+                pairing_order=1,
+            )
+            white_players = players[:2] if white_team == team1 else players[2:]
+            black_players = players[2:] if white_team == team1 else players[:2]
+            for board in (1, 2):
+                TeamPlayerPairing.objects.create(
+                    team_pairing=team_pairing,
+                    board_number=board,
+                    white=white_players[board - 1],
+                    black=black_players[board - 1],
+                    result="1-0",
+                )
+        Round.objects.filter(season=season).update(
+            knockout_stage="final",
+            knockout_multi_round_group="final",
+            is_completed=True,
+        )
+
+        tournament = multi_match_knockout_to_structure(season)
+
+        self.assertEqual(len(tournament.rounds), 1)
+        aggregated_round = tournament.rounds[0]
+        self.assertEqual(aggregated_round.number, 1)
+        self.assertEqual(aggregated_round.knockout_stage, "final")
+        self.assertEqual(len(aggregated_round.matches), 1)
+        match = aggregated_round.matches[0]
+        self.assertEqual((match.competitor1_id, match.competitor2_id), (team1.id, team2.id))
+        self.assertEqual(len(match.games), 4)
+        self.assertEqual(match.games_per_match, 4)
+
     def test_tournament_builder_with_existing_league_sets_boards(self):
         """Test that boards are properly set when using TournamentBuilder with an existing league."""
         from heltour.tournament.builder import TournamentBuilder
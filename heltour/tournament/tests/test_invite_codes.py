@@ -462,3 +462,36 @@ class InviteCodeTestCase(TestCase):
             self.assertEqual(code.team, team)
             self.assertEqual(code.created_by_captain, captain)
             self.assertTrue(code.is_available())
+
+    def test_code_generation_form_regenerates_colliding_codes(self):
+        """Test that generated codes colliding with existing ones are replaced"""
+        team = Team.objects.create(season=self.season, number=1, name="Collision Team")
+        InviteCode.objects.create(
+            league=self.league,
+            season=self.season,
+            code="CHESS-KNIGHT-TAKEN123",
+            code_type="captain",
+        )
+
+        form = GenerateTeamInviteCodeForm(
+            data={"count": 2}, team=team, season=self.season, player=None
+        )
+        self.assertTrue(form.is_valid())
+
+        with patch.object(
+            InviteCode,
+            "generate_code",
+            side_effect=[
+                "CHESS-KNIGHT-TAKEN123",
+                "CHESS-KNIGHT-FREE0001",
+                "CHESS-KNIGHT-FREE0002",
+                "CHESS-KNIGHT-FREE0003",
+            ],
+        ):
+            codes = form.save(created_by=self.system_user)
+
+        self.assertEqual(
+            sorted(code.code for code in codes),
+            ["CHESS-KNIGHT-FREE0002", "CHESS-KNIGHT-FREE0003"],
+        )
+        self.assertEqual(InviteCode.objects.filter(team=team).count(), 2)
@@ -10,6 +10,7 @@ from heltour.tournament.models import (
     AlternateBucket,
     AlternatesManagerSetting,
     format_score,
+    GameNomination,
     get_fide_dp,
     get_gameid_from_gamelink,
     League,
@@ -21,6 +22,7 @@ from heltour.tournament.models import (
     Player,
     PlayerBye,
     PlayerLateRegistration,
+    PlayerNotificationSetting,
     PlayerPairing,
     RATING_TYPE_OPTIONS,
     Registration,
@@ -1150,6 +1152,92 @@ class ModRequestTestCase(TestCase):
         self.assertEqual(mr.status, "rejected")
 
 
+class PlayerNotificationSettingTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        createCommonLeagueData()
+        cls.p1 = get_player("Player1")
+        cls.league = get_league("team")
+
+    def test_get_or_default(self):
+        default = PlayerNotificationSetting.get_or_default(
+            player=self.p1, league=self.league, type="game_warning"
+        )
+        self.assertIsNone(default.pk)
+        self.assertTrue(default.enable_lichess_mail)
+        self.assertFalse(default.enable_slack_im)
+
+        saved = PlayerNotificationSetting.objects.create(
+            player=self.p1,
+            league=self.league,
+            type="game_warning",
+            enable_lichess_mail=False,
+            enable_slack_im=True,
+            enable_slack_mpim=False,
+        )
+        self.assertEqual(
+            PlayerNotificationSetting.get_or_default(
+                player=self.p1, league=self.league, type="game_warning"
+            ),
+            saved,
+        )
+
+    def test_notifications_form_initial(self):
+        from heltour.tournament.forms import NotificationsForm
+
+        PlayerNotificationSetting.objects.create(
+            player=self.p1,
+            league=self.league,
+            type="game_warning",
+            enable_lichess_mail=False,
+            enable_slack_im=True,
+            enable_slack_mpim=False,
+        )
+        form = NotificationsForm(self.league, self.p1)
+        self.assertTrue(form.fields["game_warning_slack"].initial)
+        self.assertTrue(form.fields["unscheduled_game_slack_wo"].initial)
+        self.assertEqual(form.fields["before_game_time_offset"].initial, 60)
+
+
+class GameNominationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        createCommonLeagueData()
+        cls.p1 = get_player("Player1")
+        cls.p2 = get_player("Player2")
+        cls.s = get_season("team")
+        cls.pairing = PlayerPairing.objects.create(
+            white=cls.p1, black=cls.p2, game_link="https://lichess.org/KT837Aut"
+        )
+
+    def _form(self, game_link):
+        from heltour.tournament.forms import NominateForm
+
+        return NominateForm(
+            self.s,
+            self.p1,
+            GameNomination.objects.filter(season=self.s, nominating_player=self.p1),
+            3,
+            PlayerPairing.objects.filter(pk=self.pairing.pk),
+            {"game_link": game_link},
+        )
+
+    def test_nominate_form_rejects_duplicates(self):
+        form = self._form("https://lichess.org/KT837Aut")
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.pairing, self.pairing)
+
+        GameNomination.objects.create(
+            season=self.s,
+            nominating_player=self.p1,
+            game_link="https://lichess.org/KT837Aut",
+            pairing=self.pairing,
+        )
+        form = self._form("https://lichess.org/KT837Aut")
+        self.assertFalse(form.is_valid())
+        self.assertIn("already nominated", form.errors["game_link"][0])
+
+
 class ScheduledEventTestCase(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -10,6 +10,8 @@ from heltour.tournament.models import (
     Season,
     Player,
     InviteCode,
+    Section,
+    SectionGroup,
     Team,
 )
 from heltour.tournament.forms import RegistrationForm
@@ -125,6 +127,66 @@ class RegistrationSettingsTestCase(TestCase):
         expected_rounds = self.season_full.round_set.count()
         self.assertEqual(len(actual_choices), expected_rounds)
 
+    def test_availability_field_removed_when_already_accepted(self):
+        """Test that weeks_unavailable field is removed for an accepted player."""
+        form = RegistrationForm(
+            season=self.season_full, player=self.player, already_accepted=True
+        )
+
+        self.assertNotIn("weeks_unavailable", form.fields)
+
+    def test_unavailable_for_all_upcoming_rounds_rejected(self):
+        """Test that a player can't mark every upcoming round as unavailable."""
+        form_data = get_valid_registration_form_data()
+        round_numbers = [str(n) for n in range(1, 9)]
+
+        form_data["weeks_unavailable"] = round_numbers
+        form = RegistrationForm(
+            data=form_data, season=self.season_full, player=self.player
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("weeks_unavailable", form.errors)
+
+        form_data["weeks_unavailable"] = round_numbers[1:]
+        form = RegistrationForm(
+            data=form_data, season=self.season_full, player=self.player
+        )
+        self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
+        self.assertEqual(
+            form.cleaned_data["weeks_unavailable"], ",".join(round_numbers[1:])
+        )
+
+    def test_section_preference_cleans_to_section(self):
+        """Test that a chosen section preference cleans to its Section."""
+        other_season = Season.objects.create(
+            league=self.league_minimal,
+            name="Test Season Minimal U1800",
+            tag="test-season-minimal-u1800",
+            rounds=8,
+            boards=4,
+            registration_open=True,
+        )
+        group = SectionGroup.objects.create(league=self.league_minimal, name="Group")
+        Section.objects.create(
+            season=self.season_minimal, section_group=group, name="Open", order=1
+        )
+        u1800 = Section.objects.create(
+            season=other_season, section_group=group, name="U1800", order=2
+        )
+
+        form_data = get_valid_registration_form_data()
+        form_data["section_preference"] = str(u1800.id)
+        form = RegistrationForm(
+            data=form_data, season=self.season_minimal, player=self.player
+        )
+
+        self.assertEqual(
+            [label for _, label in form.fields["section_preference"].choices],
+            ["No preference (use my rating)", "Open", "U1800"],
+        )
+        self.assertTrue(form.is_valid(), f"Form errors: {form.errors}")
+        self.assertEqual(form.cleaned_data["section_preference"], u1800)
+
     def test_availability_field_removed_when_disabled(self):
         """Test that weeks_unavailable field is removed when ask_availability=False."""
         form = RegistrationForm(season=self.season_minimal, player=self.player)
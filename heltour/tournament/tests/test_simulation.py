@@ -2,9 +2,54 @@
 Tests for the tournament simulation framework.
 """
 
-from django.test import TestCase
+import random
+
+from django.test import SimpleTestCase, TestCase
 from heltour.tournament.db_to_structure import season_to_tournament_structure
-from heltour.tournament.builder import TournamentBuilder
+from heltour.tournament.builder import (
+    TournamentBuilder,
+    simulate_game_result,
+    simulate_game_results,
+)
+
+VALID_RESULTS = {"1-0", "1/2-1/2", "0-1", "1X-0F", "0F-1X", "0F-0F"}
+
+
+class SimulateGameResultsTests(SimpleTestCase):
+    """Tests for the rating-based result simulation helpers."""
+
+    def test_batch_returns_one_result_per_game(self):
+        results = simulate_game_results([2000, 1500, 1800], [1500, 2000, 1800])
+        self.assertEqual(len(results), 3)
+        self.assertTrue(set(results) <= VALID_RESULTS)
+
+    def test_batch_without_forfeits(self):
+        results = simulate_game_results([1500] * 200, [1500] * 200, allow_forfeit=False)
+        self.assertFalse({"1X-0F", "0F-1X", "0F-0F"} & set(results))
+
+    def test_batch_all_forfeits(self):
+        results = simulate_game_results([1500] * 50, [1500] * 50, forfeit_rate=1.0)
+        self.assertTrue(set(results) <= {"1X-0F", "0F-1X", "0F-0F"})
+
+    def test_batch_rejects_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            simulate_game_results([1500, 1500], [1500])
+
+    def test_empty_batch(self):
+        self.assertEqual(simulate_game_results([], []), [])
+
+    def test_large_rating_gap_favours_stronger_player(self):
+        results = simulate_game_results([3500] * 100, [500] * 100, allow_forfeit=False)
+        self.assertNotIn("0-1", results)
+
+    def test_seeded_results_are_reproducible(self):
+        random.seed(4545)
+        first = simulate_game_results([1800] * 50, [1700] * 50)
+        random.seed(4545)
+        self.assertEqual(simulate_game_results([1800] * 50, [1700] * 50), first)
+
+    def test_single_game(self):
+        self.assertIn(simulate_game_result(2000, 1500), VALID_RESULTS)
 
 
 class TournamentSimulationTests(TestCase):
@@ -313,3 +358,53 @@ class TournamentSimulationTests(TestCase):
         self.assertEqual(results[players["Diana"]].match_points, 2)
         # Eve: 1 draw (1 pt), 1 loss (0 pt), 1 bye (1 pt) = 2 match points
         self.assertEqual(results[players["Eve"]].match_points, 2)
+
+    def test_simulate_team_round_results(self):
+        """Simulated board results are saved and team points refreshed."""
+        from heltour.tournament.models import TeamPairing, TeamPlayerPairing
+
+        builder = (
+            TournamentBuilder()
+            .league("Sim League", "SL", "team")
+            .season("SL", "Sim Season", rounds=1, boards=2)
+            .team("Alpha", ("AlphaBoard1", 2000), ("AlphaBoard2", 1900))
+            .team("Beta", ("BetaBoard1", 1950), ("BetaBoard2", 1850))
+            .build()
+        )
+        season = builder.current_season
+        alpha = season.team_set.get(name="Alpha")
+        beta = season.team_set.get(name="Beta")
+        alpha_players = [tm.player for tm in alpha.teammember_set.order_by("board_number")]
+        beta_players = [tm.player for tm in beta.teammember_set.order_by("board_number")]
+
+        round1 = builder.start_round(1)
+        team_pairing = TeamPairing.objects.create(
+            white_team=alpha, black_team=beta, round=round1, pairing_order=1
+        )
+        TeamPlayerPairing.objects.create(
+            team_pairing=team_pairing,
+            board_number=1,
+            white=alpha_players[0],
+            black=beta_players[0],
+        )
+        TeamPlayerPairing.objects.create(
+            team_pairing=team_pairing,
+            board_number=2,
+            white=beta_players[1],
+            black=alpha_players[1],
+        )
+
+        builder.simulate_round_results(round1)
+
+        boards = list(
+            TeamPlayerPairing.objects.filter(team_pairing=team_pairing).order_by(
+                "board_number"
+            )
+        )
+        self.assertTrue(all(board.result in VALID_RESULTS for board in boards))
+
+        team_pairing.refresh_from_db()
+        alpha_points = boards[0].white_score() + boards[1].black_score()
+        beta_points = boards[0].black_score() + boards[1].white_score()
+        self.assertEqual(team_pairing.white_points, alpha_points)
+        self.assertEqual(team_pairing.black_points, beta_points)
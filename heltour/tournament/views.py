@@ -3580,7 +3580,9 @@ class TeamManageView(LoginRequiredMixin, SeasonView):
     def view(self, team_number):
         from heltour.tournament.forms import GenerateTeamInviteCodeForm, BoardOrderForm, TeamNameEditForm
 
-        team = get_object_or_404(Team, season=self.season, number=team_number)
+        team = get_object_or_404(
+            Team.objects.select_related("season"), season=self.season, number=team_number
+        )
 
         # Check permissions
         if not self.can_manage_team(team):
@@ -3647,7 +3649,9 @@ class TeamManageView(LoginRequiredMixin, SeasonView):
     def view_post(self, team_number):
         from heltour.tournament.forms import GenerateTeamInviteCodeForm, BoardOrderForm, TeamNameEditForm
 
-        team = get_object_or_404(Team, season=self.season, number=team_number)
+        team = get_object_or_404(
+            Team.objects.select_related("season__league"), season=self.season, number=team_number
+        )
 
         # Check permissions
         if not self.can_manage_team(team):
@@ -3729,7 +3733,9 @@ class TeamManageView(LoginRequiredMixin, SeasonView):
 
         # If we get here, re-render the page (either no action or form was invalid)
         # Need to rebuild the context with form errors if applicable
-        team = get_object_or_404(Team, season=self.season, number=team_number)
+        team = get_object_or_404(
+            Team.objects.select_related("season"), season=self.season, number=team_number
+        )
         team_members = team.teammember_set.select_related("player").order_by(
             "board_number"
         )
@@ -4246,7 +4252,8 @@ class TvView(LeagueView):
             active_season = _get_default_season(self.league.tag, True)
 
         boards = active_season.board_number_list() if active_season is not None and active_season.boards is not None else None
-        teams = active_season.team_set.order_by('name') if active_season is not None else None
+        teams = active_season.team_set.only('number', 'name').order_by(
+            'name') if active_season is not None else None
 
         filter_form = TvFilterForm(current_league=self.league, leagues=leagues, boards=boards,
                                    teams=teams)
@@ -15,6 +15,7 @@ from heltour.tournament_core.structure import (
     Game,
     Player,
     GameResult,
+    REVERSED_GAME_RESULTS,
     TournamentFormat,
     create_single_game_match,
     create_team_match,
@@ -505,12 +506,9 @@ class TournamentBuilder:
                     new_game = Game(player1_obj, player2_obj, game_result)
                 else:
                     # Flip the game result if player order is swapped
-                    flipped_result = game_result
-                    if game_result == GameResult.P1_WIN:
-                        flipped_result = GameResult.P2_WIN
-                    elif game_result == GameResult.P2_WIN:
-                        flipped_result = GameResult.P1_WIN
-                    new_game = Game(player2_obj, player1_obj, flipped_result)
+                    new_game = Game(
+                        player2_obj, player1_obj, REVERSED_GAME_RESULTS[game_result]
+                    )
                 
                 # Update match with new game
                 updated_match = Match(
@@ -0,0 +1,40 @@
+"""
+Elo expected-score calculations.
+
+The expected score is read from a precomputed table indexed by the rating
+difference, so callers simulating many games avoid a float power per game.
+"""
+
+from typing import List, Sequence
+
+# Expected score indexed by (opponent_rating - rating), clamped to
+# +/- ELO_MAX_DIFF. Beyond that the expectation is effectively 0 or 1.
+ELO_MAX_DIFF = 1000
+_ELO_EXPECTED = tuple(
+    1 / (1 + 10 ** (diff / 400)) for diff in range(-ELO_MAX_DIFF, ELO_MAX_DIFF + 1)
+)
+
+
+def elo_expected(rating: float, opponent_rating: float) -> float:
+    """Return the expected score of a player against an opponent."""
+    diff = int(opponent_rating - rating)
+    if diff > ELO_MAX_DIFF:
+        diff = ELO_MAX_DIFF
+    elif diff < -ELO_MAX_DIFF:
+        diff = -ELO_MAX_DIFF
+    return _ELO_EXPECTED[diff + ELO_MAX_DIFF]
+
+
+def elo_expected_batch(
+    ratings: Sequence[float], opponent_ratings: Sequence[float]
+) -> List[float]:
+    """Return elo_expected() for each pair of ratings, in order."""
+    if len(ratings) != len(opponent_ratings):
+        raise ValueError("ratings and opponent_ratings must have the same length")
+
+    expected = _ELO_EXPECTED
+    max_diff = ELO_MAX_DIFF
+    return [
+        expected[min(max(int(opponent - rating), -max_diff), max_diff) + max_diff]
+        for rating, opponent in zip(ratings, opponent_ratings)
+    ]
@@ -8,7 +8,7 @@ This module provides a simple, clean way to represent tournaments with:
 - Scoring functions to convert game results to match points
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
@@ -43,6 +43,18 @@ class GameResult(Enum):
     DOUBLE_FORFEIT = "0F-0F"
 
 
+# The same result seen from the other side of the board (player 1 and player 2
+# swapped). A table lookup keeps colour reversal branch-free in hot loops.
+REVERSED_GAME_RESULTS: Dict[GameResult, GameResult] = {
+    GameResult.P1_WIN: GameResult.P2_WIN,
+    GameResult.P2_WIN: GameResult.P1_WIN,
+    GameResult.DRAW: GameResult.DRAW,
+    GameResult.P1_FORFEIT_WIN: GameResult.P2_FORFEIT_WIN,
+    GameResult.P2_FORFEIT_WIN: GameResult.P1_FORFEIT_WIN,
+    GameResult.DOUBLE_FORFEIT: GameResult.DOUBLE_FORFEIT,
+}
+
+
 @dataclass(frozen=True)
 class Game:
     """A single game between two players."""
@@ -209,6 +221,28 @@ class Round:
         """Return a new Round with the match added (immutable pattern)."""
         return Round(self.number, self.matches + [match], self.knockout_stage)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        number: int,
+        competitor1_ids: Sequence[int],
+        competitor2_ids: Sequence[int],
+        results: Sequence[GameResult],
+        knockout_stage: Optional[str] = None,
+    ) -> "Round":
+        """Build a round of single-game matches from parallel columns.
+
+        Lets callers collect plain ids and results while reading rows and
+        construct all the Match/Game objects in one pass at the end.
+        """
+        if not len(competitor1_ids) == len(competitor2_ids) == len(results):
+            raise ValueError("Round columns must all have the same length")
+        matches = [
+            create_single_game_match(c1_id, c2_id, result)
+            for c1_id, c2_id, result in zip(competitor1_ids, competitor2_ids, results)
+        ]
+        return cls(number, matches, knockout_stage)
+
 
 @dataclass
 class Tournament:
@@ -392,6 +426,8 @@ def create_team_match(
     team2_id: int,
     board_results: List[Tuple[int, int, GameResult]],
     player_team_mapping: Optional[Dict[int, int]] = None,
+    games_per_match: int = 1,
+    manual_tiebreak_value: Optional[float] = None,
 ) -> Match:
     """
     Create a team match with multiple boards.
@@ -403,22 +439,34 @@ def create_team_match(
                       If player_team_mapping is provided, players can be in any order
                       If not provided, assumes player1 belongs to team1, player2 to team2
         player_team_mapping: Optional dict mapping player_id to team_id
+        games_per_match: Number of games in the match (for knockout matches)
+        manual_tiebreak_value: Arbiter-set tiebreak value (for knockout matches)
     """
-    games = []
-    for p1_id, p2_id, result in board_results:
-        if player_team_mapping:
-            # Use the mapping to determine which team each player belongs to
-            # Special case: -1 means no player (forfeit)
-            p1_team = -1 if p1_id == -1 else player_team_mapping.get(p1_id, team1_id)
-            p2_team = -1 if p2_id == -1 else player_team_mapping.get(p2_id, team2_id)
-            player1 = Player(p1_id, p1_team)
-            player2 = Player(p2_id, p2_team)
-        else:
-            # Legacy behavior: assume player1 is from team1, player2 from team2
-            player1 = Player(p1_id, team1_id)
-            player2 = Player(p2_id, team2_id)
-        games.append(Game(player1, player2, result))
-    return Match(team1_id, team2_id, games)
+    if player_team_mapping:
+        # Use the mapping to determine which team each player belongs to
+        # Special case: -1 means no player (forfeit)
+        team_of = player_team_mapping.get
+        games = [
+            Game(
+                Player(p1_id, -1 if p1_id == -1 else team_of(p1_id, team1_id)),
+                Player(p2_id, -1 if p2_id == -1 else team_of(p2_id, team2_id)),
+                result,
+            )
+            for p1_id, p2_id, result in board_results
+        ]
+    else:
+        # Legacy behavior: assume player1 is from team1, player2 from team2
+        games = [
+            Game(Player(p1_id, team1_id), Player(p2_id, team2_id), result)
+            for p1_id, p2_id, result in board_results
+        ]
+    return Match(
+        team1_id,
+        team2_id,
+        games,
+        games_per_match=games_per_match,
+        manual_tiebreak_value=manual_tiebreak_value,
+    )
 
 
 def create_tournament_from_matches(
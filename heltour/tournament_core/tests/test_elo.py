@@ -0,0 +1,42 @@
+"""
+Unit tests for the Elo expected-score helpers.
+"""
+
+import unittest
+
+from heltour.tournament_core.elo import elo_expected, elo_expected_batch
+
+
+class EloExpectedTests(unittest.TestCase):
+    def test_equal_ratings(self):
+        self.assertAlmostEqual(elo_expected(1500, 1500), 0.5)
+
+    def test_matches_formula(self):
+        for rating, opponent in [(1500, 1700), (2000, 1600), (1234, 1567)]:
+            formula = 1 / (1 + 10 ** ((opponent - rating) / 400))
+            self.assertAlmostEqual(elo_expected(rating, opponent), formula)
+
+    def test_symmetry(self):
+        self.assertAlmostEqual(
+            elo_expected(1800, 1500) + elo_expected(1500, 1800), 1.0
+        )
+
+    def test_large_gap_is_clamped(self):
+        self.assertEqual(elo_expected(3000, 500), elo_expected(2500, 1500))
+        self.assertEqual(elo_expected(500, 3000), elo_expected(1500, 2500))
+
+    def test_batch_matches_single(self):
+        ratings = [1500, 1800, 900, 2700]
+        opponents = [1500, 1400, 2600, 1000]
+        self.assertEqual(
+            elo_expected_batch(ratings, opponents),
+            [elo_expected(r, o) for r, o in zip(ratings, opponents)],
+        )
+
+    def test_batch_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            elo_expected_batch([1500], [1500, 1600])
+
+
+if __name__ == "__main__":
+    unittest.main()
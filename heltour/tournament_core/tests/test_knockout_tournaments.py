@@ -476,6 +476,30 @@ class TestTournamentBuilderKnockoutIntegration(unittest.TestCase):
 
         self.assertEqual(match.games_per_match, 3)
 
+    def test_builder_game_with_swapped_players_flips_result(self):
+        """Games given in reverse player order are stored from the match's side."""
+        builder = (
+            TournamentBuilder()
+            .knockout_format()
+            .games_per_match(2)
+            .league("Test", "T", "individual")
+            .player("Alice")
+            .player("Bob")
+            .bracket_seeding(["Alice", "Bob"], "adjacent")
+            .game("Bob", "Alice", "1-0")
+            .game("Bob", "Alice", "1X-0F")
+        )
+
+        tournament = builder.build()
+        match = tournament.rounds[0].matches[0]
+        alice_id = builder.metadata.players["Alice"]
+
+        self.assertEqual(match.competitor1_id, alice_id)
+        self.assertEqual(
+            [game.result for game in match.games],
+            [GameResult.P2_WIN, GameResult.P2_FORFEIT_WIN],
+        )
+
     def test_builder_knockout_stage_naming(self):
         """Test knockout stage naming in builder."""
         builder = (
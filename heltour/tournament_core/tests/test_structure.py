@@ -5,6 +5,7 @@ Tests for tournament utilities and tiebreak calculations using clean tournament
 import unittest
 
 from heltour.tournament_core.structure import (
+    REVERSED_GAME_RESULTS,
     Game,
     GameResult,
     Player,
@@ -41,6 +42,49 @@ class TournamentUtilsTests(unittest.TestCase):
         self.assertEqual(p1_pts, 1.0)
         self.assertEqual(p2_pts, 0.0)
 
+    def test_reversed_game_results(self):
+        """Reversing a result swaps the players' points."""
+        player1 = Player(1, 1)
+        player2 = Player(2, 2)
+        for result in GameResult:
+            reversed_result = REVERSED_GAME_RESULTS[result]
+            self.assertEqual(REVERSED_GAME_RESULTS[reversed_result], result)
+            p1_pts, p2_pts = Game(player1, player2, result).points()
+            self.assertEqual(
+                Game(player2, player1, reversed_result).points(), (p2_pts, p1_pts)
+            )
+
+    def test_round_from_arrays(self):
+        """Round.from_arrays builds one single-game match per column entry."""
+        round_ = Round.from_arrays(
+            2, [1, 3], [2, 4], [GameResult.P1_WIN, GameResult.DRAW], "final"
+        )
+        self.assertEqual(round_.number, 2)
+        self.assertEqual(round_.knockout_stage, "final")
+        self.assertEqual(
+            round_.matches,
+            [
+                create_single_game_match(1, 2, GameResult.P1_WIN),
+                create_single_game_match(3, 4, GameResult.DRAW),
+            ],
+        )
+        with self.assertRaises(ValueError):
+            Round.from_arrays(1, [1], [2, 3], [GameResult.P1_WIN])
+
+    def test_team_match_knockout_fields(self):
+        """create_team_match passes knockout settings through to the Match."""
+        board_results = [(1, 3, GameResult.P1_WIN), (2, 4, GameResult.P2_WIN)]
+        match = create_team_match(
+            10, 20, board_results, games_per_match=2, manual_tiebreak_value=1.0
+        )
+        self.assertEqual(match.games_per_match, 2)
+        self.assertEqual(match.manual_tiebreak_value, 1.0)
+        self.assertEqual(len(match.games), 2)
+
+        default_match = create_team_match(10, 20, board_results)
+        self.assertEqual(default_match.games_per_match, 1)
+        self.assertIsNone(default_match.manual_tiebreak_value)
+
     def test_simple_round_robin(self):
         """Test a simple 3-player round robin tournament."""
         # Define the tournament structure